@@ -9,14 +9,21 @@
 import time
 import copy
 import logging
+import operator
+import functools
+import threading
 from enum import Enum
-from time import ctime
-from typing import Dict, List, Optional, Any, Type, cast
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Any, Set, Tuple, Type, cast
 from typing_extensions import Self # type: ignore
 from typing import ClassVar, Dict, List
+try:
+    import orjson # type: ignore
+except ImportError:
+    # orjson is optional, responses are parsed with the standard library instead
+    orjson = None
 
 from dunetuf.cdm import CDM, get_cdm_instance
-from dunetuf.cdm.CdmEndpoints import CdmEndpoints
 from dunetuf.udw.udw import Underware, get_underware_instance
 from dunetuf.ssh import SSH
 from dunetuf.job.job import Job
@@ -34,6 +41,54 @@ from dunetuf.common.base.abstract_job_actions import AbstractJobActions
 
 Cancel = Enum('Cancel', 'no after_init after_start after_create submit_and_exit submit_preview_and_exit after_preview') #TODO: REMOVE
 
+
+class _StrValueEnum(str, Enum):
+    """
+    String enum that compares, prints and formats as its value.
+    Works like enum.StrEnum, which needs Python 3.11.
+    """
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+class CopyJobState(_StrValueEnum):
+    """Job states polled for by the copy job flows."""
+    CREATED = 'created'
+    READY = 'ready'
+    PROCESSING = 'processing'
+    COMPLETED = 'completed'
+
+
+class CopyJobAction(_StrValueEnum):
+    """Job state requested with each copy job transition."""
+    INITIALIZE = 'initializeProcessing'
+    START = 'startProcessing'
+    PREPARE = 'prepareProcessing'
+
+# SSH connections to the devices under test, keyed by ip address
+_ssh_connections: Dict[str, SSH] = {}
+_ssh_lock = threading.Lock()
+
+# Copy settings read by Copy.build_payload, as (settings key, ticket field) pairs
+_SRC_FIELDS = (("color_mode", "colorMode"), ("resolution", "resolution"))
+_DEST_FIELDS = (("copies", "copies"), ("rotate", "rotate"), ("mediaSource", "mediaSource"))
+_OUTPUT_CANVAS_FIELDS = ("outputCanvasMediaSize", "outputCanvasMediaId", "outputCanvasCustomWidth",
+                         "outputCanvasCustomLength", "outputCanvasAnchor", "outputCanvasOrientation")
+
+
+def _ensure_ok(response: Any, message: str) -> None:
+    """
+    Raise if a raw CDM response is not a 2xx success.
+    An explicit raise keeps the check active when Python runs with -O, unlike an assert.
+    Args:
+        response: Response returned by a CDM *_raw call
+        message: Description of the request that failed
+    Raises:
+        RuntimeError: If the status code is not in the 2xx range
+    """
+    if not 200 <= response.status_code < 300:
+        raise RuntimeError(f"{message}: {response.status_code} {response.text[:200]}")
+
 # TODO: Decouple the Job object usage from this class
 class Copy(AbstractJobActions):
     """
@@ -58,7 +113,16 @@ class Copy(AbstractJobActions):
         
         return super().__new__(cls)
     
-    def __init__(self, cdm: Optional[CDM] = None, udw: Optional[Underware] = None):
+    # Bounds for the interval used when polling the job state
+    MIN_POLL_INTERVAL = 0.1
+    MAX_POLL_INTERVAL = 2.0
+
+    # Seconds a cached device read stays valid
+    CONSTRAINTS_CACHE_TTL = 2
+    # Reads used as device state checks, kept just long enough to share between back to back checks
+    COPY_MODE_CACHE_TTL = 0.5
+
+    def __init__(self, cdm: Optional[CDM] = None, udw: Optional[Underware] = None, poll_interval: float = MIN_POLL_INTERVAL):
         """
         Initialize the Copy class.
         
@@ -69,13 +133,28 @@ class Copy(AbstractJobActions):
         Args:
             cdm: Optional CDM instance. If not provided, one will be created automatically.
             udw: Optional Underware instance. If not provided, one will be created automatically.
+            poll_interval: Seconds before the first job state re-poll, doubled on each further poll
+                           up to MAX_POLL_INTERVAL. Values below MIN_POLL_INTERVAL are raised to it.
         """
         # Get the device IP address
         ip_address = get_ip()
         
-        # Initialize underware and CDM interfaces, using provided instances or creating new ones
-        self._udw = udw if udw is not None else get_underware_instance(ip=ip_address)
-        self._cdm = cdm if cdm is not None else get_cdm_instance(addr=ip_address, udw=self._udw)
+        # Initialize underware and CDM interfaces, using provided instances or the ones opened by __new__,
+        # so that every instance talks to the device through the same clients and their open connections
+        shared_udw = getattr(type(self), "_udw", None)
+        shared_cdm = getattr(type(self), "_cdm", None)
+        if udw is not None:
+            self._udw = udw
+        elif shared_udw is not None:
+            self._udw = shared_udw
+        else:
+            self._udw = get_underware_instance(ip=ip_address)
+        if cdm is not None:
+            self._cdm = cdm
+        elif shared_cdm is not None and self._udw is shared_udw:
+            self._cdm = shared_cdm
+        else:
+            self._cdm = get_cdm_instance(addr=ip_address, udw=self._udw)
         
         # Initialize job management objects
         self._job: Job = Job(self._cdm, self._udw)
@@ -84,15 +163,64 @@ class Copy(AbstractJobActions):
         self._job_configuration = JobConfiguration()
         self._job_capabilities = JobCapabilities()
         
-        # Initialize device configuration and properties
-        self._configuration = Configuration(self._cdm)
-        self._family_name = self._configuration.familyname
+        # Initialize device configuration and properties, reusing the ones read by __new__
+        configuration = getattr(type(self), "_configuration", None)
+        if configuration is not None and cdm is None:
+            self._configuration = configuration
+            self._family_name = type(self)._family_name
+        else:
+            self._configuration = Configuration(self._cdm)
+            self._family_name = self._configuration.familyname
         
         # Initialize state variables with None (will be set during copy operations)
         self._adf_loaded = None
         self._output_duplex = None
         self._duplex = None
 
+        self._poll_interval = max(poll_interval, self.MIN_POLL_INTERVAL)
+
+        # Device reads cached as key -> (read time, payload), dropped when the value is set
+        self._config_cache: Dict[str, Tuple[float, Any]] = {}
+        # Whether a ticket uses the two segment pipeline, keyed by ticket id
+        self._two_segment_cache: Dict[str, bool] = {}
+
+    @classmethod
+    def invalidate_configuration_cache(cls) -> None:
+        """
+        Drop the device clients and configuration stored on the class by Copy.__new__.
+        The next instance connects and reads the configuration from the device again.
+        Returns:
+            None
+        """
+        Copy._udw = None
+        Copy._cdm = None
+        Copy._configuration = None
+        Copy._family_name = None
+        Copy._product_name = None
+
+    @property
+    def configuration(self) -> Configuration:
+        """
+        Device configuration currently used by the instance.
+        Returns:
+            Configuration: The configuration of the device under test
+        """
+        return self._configuration
+
+    @functools.cached_property
+    def _is_mdf_device(self) -> bool:
+        """
+        Whether the device has an MDF input, queried once per instance.
+        """
+        return "mdf" in self._udw.mainApp.ScanMedia.listInputDevices().lower()
+
+    @functools.cached_property
+    def _breakpoint(self) -> str:
+        """
+        Control panel breakpoint of the device, queried once per instance.
+        """
+        return self._udw.mainUiApp.ControlPanel.getBreakPoint()
+
     def create_ticket(self, payload: Dict = {}, passwords: str = '', headers=None) -> str:
         """
         Creates a copy job ticket with the provided settings.
@@ -113,7 +241,7 @@ class Copy(AbstractJobActions):
 
         # Only update the ticket if there are settings to apply
         if payload:
-            logging.info('Payload copy job ticket : {}'.format(payload))
+            logging.info('Payload copy job ticket : %s', payload)
             self._job_ticket.update(ticket_id, payload)
 
         return ticket_id
@@ -128,6 +256,7 @@ class Copy(AbstractJobActions):
         Returns:
             int: Status code of the response
         """
+        self._two_segment_cache.pop(ticketId, None)
         return self._job_ticket.update(ticketId, payload, update_expected)
 
     def clone_ticket(self, payload:Dict) -> str:
@@ -210,7 +339,7 @@ class Copy(AbstractJobActions):
         """
         self.preview_start(job_id, ticket_id, preview_reps)
 
-        start_state = self.change_job_state(job_id, 'Start', 'startProcessing')
+        start_state = self.change_job_state(job_id, 'Start', CopyJobAction.START)
         return start_state
 
     def preview_start(self, job_id: str, ticket_id: str, preview_reps: int = 0) -> None:
@@ -221,25 +350,59 @@ class Copy(AbstractJobActions):
             ticket_id: ticket id
             preview_reps: Number of times to repeat the preview before executing the copy job
         Returns:
-            None
+            None. The job is in the ready state when this method returns.
         """
         logging.info('Starting job : %s', job_id)
-        job_ready = False
 
-        initialize_pending_state = self._job_manager.change_job_state(job_id, 'Initialize', 'initializeProcessing')
+        initialize_pending_state = self._job_manager.change_job_state(job_id, 'Initialize', CopyJobAction.INITIALIZE)
         assert initialize_pending_state == 200
 
-        start_time = time.time()
+        self._wait_until_ready(job_id)
 
-        while((time.time() - start_time) < self._job_manager.WAIT_START_JOB_TIMEOUT):
-            job_info = self.get_job_info(job_id)
-            if job_info.get('state') == 'ready':
-                job_ready = True
-                break
-            else:
-                time.sleep(2)
-        if not job_ready:
-            raise TimeoutError("Job has not reached the ready state after {0} seconds".format(self._job_manager.WAIT_START_JOB_TIMEOUT))
+    def _wait_until_ready(self, job_id: str, timeout: Optional[float] = None, interval: Optional[float] = None) -> None:
+        """
+        Poll the job until it reaches the ready state.
+        Args:
+            job_id: job id
+            timeout: Maximum time to wait in seconds. Defaults to the job manager start timeout.
+            interval: Seconds before the first re-poll. Defaults to the poll interval given at construction.
+        Raises:
+            TimeoutError if the job is not ready within ``timeout`` seconds
+        """
+        if timeout is None:
+            timeout = self._job_manager.WAIT_START_JOB_TIMEOUT
+        if interval is None:
+            interval = self._poll_interval
+
+        self._poll_until(
+            lambda: self.get_job_info(job_id).get('state') == CopyJobState.READY,
+            timeout=timeout,
+            initial=interval,
+            timeout_message="Job has not reached the ready state after {0} seconds".format(timeout),
+        )
+
+    @staticmethod
+    def _poll_until(predicate: Callable[[], bool], *, timeout: float, initial: float = MIN_POLL_INTERVAL,
+                    max_interval: float = MAX_POLL_INTERVAL, timeout_message: str = "") -> None:
+        """
+        Call predicate until it returns True, doubling the delay between calls up to max_interval.
+        Args:
+            predicate: Condition to wait for
+            timeout: Maximum time to wait in seconds
+            initial: Delay in seconds before the first re-check
+            max_interval: Upper bound for the delay between checks
+            timeout_message: Message of the TimeoutError raised when the condition is not met
+        Raises:
+            TimeoutError if predicate does not return True within ``timeout`` seconds
+        """
+        interval = initial
+        start_time = time.monotonic()
+        while (time.monotonic() - start_time) < timeout:
+            if predicate():
+                return
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+        raise TimeoutError(timeout_message or "Condition not met after {0} seconds".format(timeout))
 
     def cancel(self, jobId: str, header = None) -> int:
         """
@@ -321,8 +484,11 @@ class Copy(AbstractJobActions):
         Returns:
             int: Status code of the update operation. 200 for success operation.
         """
-        print("updating default ticket")
-        return self._job_ticket.update_configuration_defaults_by_type('copy', payload)
+        logging.info("updating default ticket")
+        self._two_segment_cache.clear()
+        status_code = self._job_ticket.update_configuration_defaults_by_type('copy', payload)
+        self._invalidate_cache('copy_constraint_options')
+        return status_code
 
     def _updating_ticket(self, payload: Dict) -> Dict:
         """
@@ -341,37 +507,72 @@ class Copy(AbstractJobActions):
                 - Sets 'duplexBinding' in 'dest' to "twoSidedLongEdge" if it is "oneSided" or not present.
         """ 
         self._adf_loaded = True
+        self._duplex = False
         self._output_duplex = False
 
-        if "src" in payload:
-            if "mediaSource" in payload['src']['scan']:
-                if payload['src']['scan']['mediaSource'] == "flatbed":
-                    self._adf_loaded = False
-            if "plexMode" in payload['src']['scan']:
-                if payload['src']['scan']['plexMode'] == "duplex":
-                    self._duplex = True
-        if "dest" in payload:
-            if "plexMode" in payload['dest']['print']:
-                if payload['dest']['print']['plexMode'] == "duplex":
-                    self._output_duplex = True
-                    if "duplexBinding" in payload['dest']['print']:
-                        if payload['dest']['print']['duplexBinding'] == "oneSided":
-                            payload['dest']['print']['duplexBinding'] = "twoSidedLongEdge"
-                    else:
-                        payload['dest']['print']['duplexBinding'] = "twoSidedLongEdge" 
+        scan_settings = payload.get('src', {}).get('scan')
+        print_settings = payload.get('dest', {}).get('print')
+
+        if scan_settings:
+            if scan_settings.get('mediaSource') == "flatbed":
+                self._adf_loaded = False
+            if scan_settings.get('plexMode') == "duplex":
+                self._duplex = True
+        if print_settings and print_settings.get('plexMode') == "duplex":
+            self._output_duplex = True
+            if print_settings.get('duplexBinding', "oneSided") == "oneSided":
+                print_settings['duplexBinding'] = "twoSidedLongEdge"
 
         return payload
 
-    def _has_two_segment_pipeline(self, ticket_id) -> bool:
+    def _get_cached(self, key: str, ttl: float, fetch: Callable[[], Any], copy_result: bool = True) -> Any:
         """
-        Check wether a printer has two segments pipeline
+        Return a device read from the cache, calling fetch when it is missing or older than ttl.
+        Callers get their own copy, so changing the result does not alter the cache.
+        Args:
+            key: Cache key
+            ttl: Seconds the cached value stays valid
+            fetch: Reads the value from the device
+            copy_result: If False, return the cached value itself. Only for values that cannot be modified
+        Returns:
+            The cached or freshly read value
         """
+        entry = self._config_cache.get(key)
+        now = time.monotonic()
+        if entry is None or now - entry[0] >= ttl:
+            entry = (now, fetch())
+            self._config_cache[key] = entry
+        return copy.deepcopy(entry[1]) if copy_result else entry[1]
+
+    def _invalidate_cache(self, *keys: str) -> None:
+        """
+        Drop cached device reads after the device value was changed.
+        Args:
+            keys: Cache keys to drop
+        """
+        for key in keys:
+            self._config_cache.pop(key, None)
+
+    def _has_two_segment_pipeline(self, ticket_id, get_ticket: Optional[Callable[[str], Dict]] = None) -> bool:
+        """
+        Check wether a printer has two segments pipeline.
+        The answer is cached per ticket id until the ticket is updated.
+        Args:
+            ticket_id: Id of the copy ticket
+            get_ticket: Reads the ticket on a cache miss. Defaults to the job ticket service
+        """
+        if ticket_id and ticket_id in self._two_segment_cache:
+            return self._two_segment_cache[ticket_id]
+        get_ticket = get_ticket or self._job_ticket.get_info
         try:
-            data = self._job_ticket.get_info(ticket_id)
-            field_value = data['src']['scan']['scanCaptureMode']
-            return field_value == 'jobBuild'
-        except:
+            data = get_ticket(ticket_id) or {}
+        except Exception:
+            logging.info("Could not read ticket %s", ticket_id)
             return False
+        two_segment = ((data.get('src') or {}).get('scan') or {}).get('scanCaptureMode') == 'jobBuild'
+        if ticket_id:
+            self._two_segment_cache[ticket_id] = two_segment
+        return two_segment
 
     def _dismiss_mdf_eject_page_alert(self) -> None: #TODO: TAKE A LOOK IF IT IS NECESSARY if "mdf" in self._udw.mainApp.ScanMedia.listInputDevices().lower() and self._udw.mainUiApp.ControlPanel.getBreakPoint() not in ["XL"]: 
         """
@@ -391,15 +592,27 @@ class Copy(AbstractJobActions):
         """
         return self._cdm.get(self._cdm.COPY_CONFIGURATION_ENDPOINT)
 
-    def set_copy_configuration(self, payload: Dict) -> None:
+    def _get_current_copy_configuration(self) -> Dict:
+        """
+        Get the copy configuration for a state check, read again once it is older than COPY_MODE_CACHE_TTL.
+        Returns:
+            Dict containing the copy configuration
+        """
+        return self._get_cached('copy_configuration', self.COPY_MODE_CACHE_TTL,
+                                lambda: self._cdm.get(self._cdm.COPY_CONFIGURATION_ENDPOINT))
+
+    def set_copy_configuration(self, payload: Optional[Dict] = None, **settings: Any) -> None:
         """
         Set copy configuration
+        Several settings are sent together in a single request, e.g. set_copy_configuration(copyMode=..., allowInterrupt=...)
         Args:
             payload: Dictionary containing the copy configuration to set
+            settings: Copy configuration fields to set, merged over payload
         Returns:
             None
         """
-        self._cdm.put(self._cdm.COPY_CONFIGURATION_ENDPOINT, payload)
+        self._invalidate_cache('copy_configuration', 'copy_constraint_options')
+        self._cdm.put(self._cdm.COPY_CONFIGURATION_ENDPOINT, {**(payload or {}), **settings})
 
     def get_copy_configuration_constraints(self) -> Dict:
         """
@@ -471,14 +684,14 @@ class Copy(AbstractJobActions):
 
         ticket_id = self.create_ticket(payload)
         job_id = self.create_job(ticket_id)
-        logging.info('Created Copy Job Id : {}'.format(job_id))
+        logging.info('Created Copy Job Id : %s', job_id)
 
-        self._job.check_job_state(job_id, 'created', max_wait_time)
-        self.change_job_state(job_id, 'Initialize', 'initializeProcessing')
+        self._job.check_job_state(job_id, CopyJobState.CREATED, max_wait_time)
+        self.change_job_state(job_id, 'Initialize', CopyJobAction.INITIALIZE)
 
-        self._job.check_job_state(job_id, 'ready', max_wait_time)
+        self._job.check_job_state(job_id, CopyJobState.READY, max_wait_time)
         # for rep in range(reps):  
-        self._job.change_job_state(job_id, 'Preview', 'prepareProcessing')
+        self._job.change_job_state(job_id, 'Preview', CopyJobAction.PREPARE)
         return ticket_id
 
     '''
@@ -505,24 +718,20 @@ class Copy(AbstractJobActions):
         ticket_id = self._job.create_job_ticket(base_payload)
 
         if bool(payload):
-            print('Payload copy job ticket : {}'.format(payload))
+            logging.info('Payload copy job ticket : %s', payload)
             self._job.update_job_ticket(ticket_id, payload)
 
         data = self._job.get_job_ticket_info(ticket_id)
-        print('Ticket ID - {}, Ticket Info - {}'.format(ticket_id, data))
+        logging.info('Ticket ID - %s, Ticket Info - %s', ticket_id, data)
 
         return ticket_id
 
     def has_two_segment_pipeline(self, ticket_id):
         """
         Check wether a printer has two segments pipeline
+        Shares the per ticket cache of _has_two_segment_pipeline.
         """
-        try:
-            data = self._job.get_job_ticket_info(ticket_id)
-            field_value = data['src']['scan']['scanCaptureMode']
-            return field_value == 'jobBuild'
-        except:
-            return False
+        return self._has_two_segment_pipeline(ticket_id, self._job.get_job_ticket_info)
 
     def proccess_job_two_segment_completion_check(self, job_id, cancel: Cancel=Cancel.no, waitTime: int=60  ):
         """
@@ -533,8 +742,8 @@ class Copy(AbstractJobActions):
             cancel : desired cancel action
             waitTime : time to wait for the action to be completed
         """
-        status_code = self._job.change_job_state(job_id, 'Prepare_Processing', 'prepareProcessing')
-        self._job.check_job_state(job_id, "processing", 30)
+        status_code = self._job.change_job_state(job_id, 'Prepare_Processing', CopyJobAction.PREPARE)
+        self._job.check_job_state(job_id, CopyJobState.PROCESSING, 30)
 
         if cancel == Cancel.submit_preview_and_exit:
             return
@@ -542,7 +751,7 @@ class Copy(AbstractJobActions):
         self._job.wait_all_previews_done(job_id)
 
         # Patch start processing to start second segment 
-        self._job.change_job_state(job_id, 'Start', 'startProcessing')
+        self._job.change_job_state(job_id, 'Start', CopyJobAction.START)
 
         it_was_canceled = False
         expected_completion_status = "success"
@@ -551,14 +760,14 @@ class Copy(AbstractJobActions):
             it_was_canceled = True
             expected_completion_status = "cancelled"
             self._job.cancel_job(job_id)
-            print('Canceled Job Id : {}'.format(job_id))
+            logging.info('Canceled Job Id : %s', job_id)
             # Wait completion status and validate is completed
 
         if cancel == Cancel.submit_and_exit:
-            print('Submitted Copy Job with Id: ' + job_id +  ' .Track it to completion.')
+            logging.info('Submitted Copy Job with Id: %s .Track it to completion.', job_id)
         else:
             # Wait completion status and validate is completed
-            self._job.check_job_state(job_id, 'completed', waitTime, it_was_canceled)
+            self._job.check_job_state(job_id, CopyJobState.COMPLETED, waitTime, it_was_canceled)
 
             # Get status job
             self._job.check_job_completion_status(job_id,expected_completion_status)
@@ -576,76 +785,47 @@ class Copy(AbstractJobActions):
         Returns:
             Return the jobid
         """
-        print('\n========== COPY Job Started ==========')
+        logging.info('========== COPY Job Started ==========')
 
-        _ssh = SSH(self._cdm.ipaddress)
         max_wait_time = waitTime
-        self.configuration = Configuration(self._cdm)
-        input_duplex = False
-        output_duplex = False
 
-        
-        if familyname == '':
-            try:
-                familyname = self.configuration.familyname
-            except:
-                logging.info("There is no information about the device.")
+        # The family name is read once, when the instance is created
+        familyname = familyname or self._family_name
+        if not familyname:
+            logging.info("There is no information about the device.")
  
-        if "src" in payload:
-            if "mediaSource" in payload['src']['scan']:
-                if payload['src']['scan']['mediaSource'] == "flatbed":
-                    adfLoaded = False
-            if "plexMode" in payload['src']['scan']:
-                if payload['src']['scan']['plexMode'] == "duplex":
-                    duplex = True
-            if "resolution" in payload['src']['scan']:
-                if familyname == "enterprise":
-                    payload['src']['scan']['resolution'] = "e600Dpi" 
-        if "dest" in payload:
-            if "plexMode" in payload['dest']['print']:
-                if payload['dest']['print']['plexMode'] == "duplex":
-                    output_duplex = True
-                    if "duplexBinding" in payload['dest']['print']:
-                        if payload['dest']['print']['duplexBinding'] == "oneSided":
-                            payload['dest']['print']['duplexBinding'] = "twoSidedLongEdge"
-                    else:
-                        payload['dest']['print']['duplexBinding'] = "twoSidedLongEdge"   
+        # The base normalization only: the e600Dpi override below follows familyname, not the class
+        payload = Copy._updating_ticket(self, payload)
+        adfLoaded = adfLoaded and self._adf_loaded
+        output_duplex = self._output_duplex
+
+        scan_settings = payload.get('src', {}).get('scan')
+        if scan_settings and "resolution" in scan_settings and familyname == "enterprise":
+            scan_settings['resolution'] = "e600Dpi"
 
         ticket_id = self.get_copy_job_ticket(payload)
           
         job_id = self._job.create_job(ticket_id, priorityModeSessionId=priorityModeSessionId)
-        print('Created Copy Job Id : {}'.format(job_id))
+        logging.info('Created Copy Job Id : %s', job_id)
          
         if cancel == Cancel.after_create:
-            self._job.cancel_job(job_id)
-
-            jobs = self._job.get_job_history()
-            job_in_history = [job for job in jobs if job.get('jobId') == job_id]
-            assert len(job_in_history) == 0, 'Unexpected job in job history!'
-
-            print('Canceled Job Id : {}'.format(job_id))
+            self._cancel_and_verify_removed(job_id)
         else:
-            self._job.check_job_state(job_id, 'created', max_wait_time)
-            self._job.change_job_state(job_id, 'Initialize', 'initializeProcessing')
-            print('Initialized Job Id : {}'.format(job_id))
+            self._job.check_job_state(job_id, CopyJobState.CREATED, max_wait_time)
+            self._job.change_job_state(job_id, 'Initialize', CopyJobAction.INITIALIZE)
+            logging.info('Initialized Job Id : %s', job_id)
             if cancel == Cancel.after_init:
-                self._job.cancel_job(job_id)
-
-                jobs = self._job.get_job_history()
-                job_in_history = [job for job in jobs if job.get('jobId') == job_id]
-                assert len(job_in_history) == 0, 'Unexpected job in job history!'
-
-                print('Canceled Job Id : {}'.format(job_id))
+                self._cancel_and_verify_removed(job_id)
             else:
-                self._job.check_job_state(job_id, 'ready', max_wait_time) 
+                self._job.check_job_state(job_id, CopyJobState.READY, max_wait_time) 
                 # Check for a product with two segment pipeline
                 if (self.has_two_segment_pipeline(ticket_id)):
-                    print("********* Two segment pipeline detected **********")
-                    print(" ## cancel =", cancel)
+                    logging.info("********* Two segment pipeline detected **********")
+                    logging.info(" ## cancel = %s", cancel)
                     self.proccess_job_two_segment_completion_check(job_id, cancel, waitTime)
                 else:          
-                    self._job.change_job_state(job_id, 'Start', 'startProcessing')
-                    print('Started Job Id : {}'.format(job_id))
+                    self._job.change_job_state(job_id, 'Start', CopyJobAction.START)
+                    logging.info('Started Job Id : %s', job_id)
                     #Pages currently set to 1 can be changed if required in future through argument
                     if familyname == "enterprise" :
                         try:
@@ -656,31 +836,93 @@ class Copy(AbstractJobActions):
                             logging.info("flatbed Add page is not available")
 
                     if cancel == Cancel.after_start:
-                        self._job.cancel_job(job_id)
-                        self._job.check_job_state(job_id, 'completed', max_wait_time, True)
-                        print('Canceled Job Id : {}'.format(job_id))
+                        self._cancel_and_wait_completed(job_id, max_wait_time)
                     else :
                         if cancel == Cancel.submit_and_exit: #reusing cancel parameter to submit job and exit without waiting for completion
-                            print('Submitted Copy Job with Id: ' + job_id +  ' .Track it to completion.')
+                            logging.info('Submitted Copy Job with Id: %s .Track it to completion.', job_id)
                         else:
                             # Due to recent change in check_job_state(introduced a sleep), during which processing state move to completed
-                            #self._job.check_job_state(job_id, 'processing', max_wait_time)
+                            #self._job.check_job_state(job_id, CopyJobState.PROCESSING, max_wait_time)
                             #print('started processing the copy job..')
-                            if "mdf" in self._udw.mainApp.ScanMedia.listInputDevices().lower() and self._udw.mainUiApp.ControlPanel.getBreakPoint() not in ["XL"]:
+                            if self._is_mdf_device and self._breakpoint != "XL":
                                 self.dismiss_mdf_eject_page_alert()
                             logging.info('About to wait for job completion. CDM Job ID: %s', job_id)
                             # Convert to UDW format for debugging
                             udw_job_id = self._job.get_jobid(job_id, guid=False)
                             logging.info('UDW Job ID will be: %s', udw_job_id)
                             self._job.wait_for_job_state(udw_job_id, state='COMPLETED', timeout=max_wait_time)
-                            print('Completed Job Id : {}'.format(job_id))
+                            logging.info('Completed Job Id : %s', job_id)
 
-        print('========== COPY Job Completed ==========')
+        logging.info('========== COPY Job Completed ==========')
 
-        print('Copy Job completed. Removing possible generated output file.')
-        _ssh.run('rm -f /tmp/PUID_*.tiff')
+        logging.info('Copy Job completed. Removing possible generated output file.')
+        self._remove_generated_output()
         return job_id
     
+    def _get_ssh(self, reconnect: bool = False) -> SSH:
+        """
+        Get the SSH connection to the device, opening it on first use.
+        The connection is shared by every copy job run against the same device.
+
+        Args:
+            reconnect: Open a new connection even if one is already cached
+
+        Returns:
+            SSH: The connection to the device
+        """
+        ip_address = self._cdm.ipaddress
+        with _ssh_lock:
+            if reconnect or ip_address not in _ssh_connections:
+                _ssh_connections[ip_address] = SSH(ip_address)
+            return _ssh_connections[ip_address]
+
+    def _remove_generated_output(self) -> None:
+        """
+        Remove the output files a copy job may leave behind on the device.
+        Reconnects once if the cached SSH connection has been dropped.
+        """
+        command = 'rm -f /tmp/PUID_*.tiff'
+        try:
+            self._get_ssh().run(command)
+        except Exception:
+            logging.info("SSH connection to %s lost, reconnecting", self._cdm.ipaddress)
+            self._get_ssh(reconnect=True).run(command)
+
+    def _cancel_and_verify_removed(self, job_id: str) -> None:
+        """
+        Cancel a job that has not been started and check that it left no trace in the job history.
+
+        Args:
+            job_id: Id of the job to cancel
+        """
+        self._job.cancel_job(job_id)
+        assert not self._job_in_history(job_id), 'Unexpected job in job history!'
+        logging.info('Canceled Job Id : %s', job_id)
+
+    def _cancel_and_wait_completed(self, job_id: str, timeout: int) -> None:
+        """
+        Cancel a started job and wait for it to complete as cancelled.
+
+        Args:
+            job_id: Id of the job to cancel
+            timeout: Timeout in seconds to wait for the job to complete
+        """
+        self._job.cancel_job(job_id)
+        self._job.check_job_state(job_id, CopyJobState.COMPLETED, timeout, True)
+        logging.info('Canceled Job Id : %s', job_id)
+
+    def _job_in_history(self, job_id: str) -> bool:
+        """
+        Check whether a job is listed in the job history.
+
+        Args:
+            job_id: Id of the job to look for
+
+        Returns:
+            True as soon as a matching history entry is found, False otherwise
+        """
+        return any(job.get('jobId') == job_id for job in self._job.get_job_history())
+
     def do_copy_preview_job(self, familyname = "", cancel: Cancel=Cancel.no, waitTime: int=60, reps: int=0, onlypreview: bool=False, **payload: Dict) -> None:
         """Configures a copy job and performs copy job
 
@@ -695,82 +937,50 @@ class Copy(AbstractJobActions):
         Returns:
             None
         """
-        print('\n========== COPY Job Started ==========')
-        _ssh = SSH(self._cdm.ipaddress)
+        logging.info('========== COPY Job Started ==========')
         max_wait_time = waitTime
-        self.configuration = Configuration(self._cdm)
-        
-        if familyname == '':
-            try:
-                familyname = self.configuration.familyname
-            except:
-                logging.info("There is no information about the device.")
+
+        # The family name is read once, when the instance is created
+        familyname = familyname or self._family_name
+        if not familyname:
+            logging.info("There is no information about the device.")
                
-        if "src" in payload:
-            if "mediaSource" in payload['src']['scan']:
-                if payload['src']['scan']['mediaSource'] == "flatbed":
-                    adfLoaded = False
-            if "plexMode" in payload['src']['scan']:
-                if payload['src']['scan']['plexMode'] == "duplex":
-                    duplex = True
-            if "resolution" in payload['src']['scan']:
-                if familyname == "enterprise":
-                    payload['src']['scan']['resolution'] = "e600Dpi" 
-        if "dest" in payload:
-            if "plexMode" in payload['dest']['print']:
-                if payload['dest']['print']['plexMode'] == "duplex":
-                    if "duplexBinding" in payload['dest']['print']:
-                        if payload['dest']['print']['duplexBinding'] == "oneSided":
-                            payload['dest']['print']['duplexBinding'] = "twoSidedLongEdge"
-                    else:
-                        payload['dest']['print']['duplexBinding'] = "twoSidedLongEdge" 
+        # adfLoaded is read from the device once the job has started.
+        # The base normalization only: the e600Dpi override below follows familyname, not the class
+        payload = Copy._updating_ticket(self, payload)
+
+        scan_settings = payload.get('src', {}).get('scan')
+        if scan_settings and "resolution" in scan_settings and familyname == "enterprise":
+            scan_settings['resolution'] = "e600Dpi"
 
         ticket_id = self.get_copy_job_ticket(payload)
         job_id = self._job.create_job(ticket_id)
-        print('Created Copy Job Id : {}'.format(job_id))
+        logging.info('Created Copy Job Id : %s', job_id)
 
         if cancel == Cancel.after_create:
-            self._job.cancel_job(job_id)
-
-            jobs = self._job.get_job_history()
-            job_in_history = [job for job in jobs if job.get('jobId') == job_id]
-            assert len(job_in_history) == 0, 'Unexpected job in job history!'
-
-            print('Canceled Job Id : {}'.format(job_id))
+            self._cancel_and_verify_removed(job_id)
         else:
-            self._job.check_job_state(job_id, 'created', max_wait_time)
-            self._job.change_job_state(job_id, 'Initialize', 'initializeProcessing')
-            print('Initialized Job Id : {}'.format(job_id))
+            self._job.check_job_state(job_id, CopyJobState.CREATED, max_wait_time)
+            self._job.change_job_state(job_id, 'Initialize', CopyJobAction.INITIALIZE)
+            logging.info('Initialized Job Id : %s', job_id)
 
             if cancel == Cancel.after_init:
-                self._job.cancel_job(job_id)
-
-                jobs = self._job.get_job_history()
-                job_in_history = [job for job in jobs if job.get('jobId') == job_id]
-                assert len(job_in_history) == 0, 'Unexpected job in job history!'
-
-                print('Canceled Job Id : {}'.format(job_id))
+                self._cancel_and_verify_removed(job_id)
             else:
-                self._job.check_job_state(job_id, 'ready', max_wait_time)
+                self._job.check_job_state(job_id, CopyJobState.READY, max_wait_time)
                 for rep in range(reps):  
-                    self._job.change_job_state(job_id, 'Preview', 'prepareProcessing')
-                    self._job.check_job_state(job_id, 'ready', max_wait_time)
-                    print('Preview Job Id : {}'.format(job_id))
+                    self._job.change_job_state(job_id, 'Preview', CopyJobAction.PREPARE)
+                    self._job.check_job_state(job_id, CopyJobState.READY, max_wait_time)
+                    logging.info('Preview Job Id : %s', job_id)
                 else:
-                    print('Previewed job {} times'.format(reps))           
+                    logging.info('Previewed job %s times', reps)
 
                 if cancel == Cancel.after_preview:
-                        self._job.cancel_job(job_id)
-
-                        jobs = self._job.get_job_history()
-                        job_in_history = [job for job in jobs if job.get('jobId') == job_id]
-                        assert len(job_in_history) == 0, 'Unexpected job in job history!'
-
-                        print('Canceled Job Id : {}'.format(job_id))
+                    self._cancel_and_verify_removed(job_id)
                 else:
-                    self._job.check_job_state(job_id, 'ready', max_wait_time)
-                    self._job.change_job_state(job_id, 'Start', 'startProcessing')
-                    print('Started Job Id : {}'.format(job_id))
+                    # The job is already known to be ready: either before the previews or after the last one
+                    self._job.change_job_state(job_id, 'Start', CopyJobAction.START)
+                    logging.info('Started Job Id : %s', job_id)
                     adfLoaded = self._udw.mainApp.ScanMedia.isMediaLoaded('ADF')
                     #Pages currently set to 1 can be changed if required in future through argument
                     pages = 1
@@ -786,23 +996,21 @@ class Copy(AbstractJobActions):
                         logging.info("flatbed Add page is not available")
 
                     if cancel == Cancel.after_start:
-                        self._job.cancel_job(job_id)
-                        self._job.check_job_state(job_id, 'completed', max_wait_time, True)
-                        print('Canceled Job Id : {}'.format(job_id))
+                        self._cancel_and_wait_completed(job_id, max_wait_time)
                     else :
                         if cancel == Cancel.submit_and_exit: #reusing cancel parameter to submit job and exit without waiting for completion
-                            print('Submitted Copy Job with Id: ' + job_id +  ' .Track it to completion.')
+                            logging.info('Submitted Copy Job with Id: %s .Track it to completion.', job_id)
                         else:
                             # Due to recent change in check_job_state(introduced a sleep), during which processing state move to completed
-                            #self._job.check_job_state(job_id, 'processing', max_wait_time)
+                            #self._job.check_job_state(job_id, CopyJobState.PROCESSING, max_wait_time)
                             #print('started processing the copy job..')
-                            self._job.check_job_state(job_id, 'completed', max_wait_time)
-                            print('Completed Job Id : {}'.format(job_id))
+                            self._job.check_job_state(job_id, CopyJobState.COMPLETED, max_wait_time)
+                            logging.info('Completed Job Id : %s', job_id)
 
-        print('========== COPY Job Completed ==========')
+        logging.info('========== COPY Job Completed ==========')
 
-        print('Copy Job completed. Removing possible generated output file.')
-        _ssh.run('rm -f /tmp/PUID_*.tiff')
+        logging.info('Copy Job completed. Removing possible generated output file.')
+        self._remove_generated_output()
     
     def start_copy_job(self, waitTime: int=60, **payload: Dict) -> str:
         """Configures a copy job and starts copy job
@@ -814,24 +1022,85 @@ class Copy(AbstractJobActions):
         Returns:
             Job id, for use in checking for completioin
         """
-        print('\n========== COPY Job Started ==========')
+        logging.info('========== COPY Job Started ==========')
         ticket_id = self.get_copy_job_ticket(payload)
 
-        _ssh = SSH(self._cdm.ipaddress)
         max_wait_time = waitTime
 
         job_id = self._job.create_job(ticket_id)
-        print('Created Copy Job Id : {}'.format(job_id))
-        self._job.check_job_state(job_id, 'created', max_wait_time)
-        self._job.change_job_state(job_id, 'Initialize', 'initializeProcessing')
-        print('Initialized Job Id : {}'.format(job_id))
-        self._job.check_job_state(job_id, 'ready', max_wait_time)           
-        self._job.change_job_state(job_id, 'Start', 'startProcessing')
-        print('Started Job Id : {}'.format(job_id))
-        self._job.check_job_state(job_id, 'processing', max_wait_time)
-        print('started processing the copy job..')
+        logging.info('Created Copy Job Id : %s', job_id)
+        self._job.check_job_state(job_id, CopyJobState.CREATED, max_wait_time)
+        self._job.change_job_state(job_id, 'Initialize', CopyJobAction.INITIALIZE)
+        logging.info('Initialized Job Id : %s', job_id)
+        self._job.check_job_state(job_id, CopyJobState.READY, max_wait_time)           
+        self._job.change_job_state(job_id, 'Start', CopyJobAction.START)
+        logging.info('Started Job Id : %s', job_id)
+        self._job.check_job_state(job_id, CopyJobState.PROCESSING, max_wait_time)
+        logging.info('started processing the copy job..')
         return job_id
 
+    # Job detail checked by validate_settings_used_in_copy for each setting, in check order:
+    # setting -> (path in the job details, log message, assertion message)
+    _SETTINGS_FIELD_SPEC: ClassVar[Dict[str, Tuple[Tuple[str, ...], str, str]]] = {
+        "original_size": (("src", "scan", "mediaSize"), "Check the original size setting", "Wrong original size setting"),
+        "paper_size": (("dest", "print", "mediaSize"), "Check the paper size setting", "Wrong paper size setting"),
+        "lighter_darker": (("pipelineOptions", "imageModifications", "exposure"), "Check the lighter/darker setting", "Wrong lighter/darker setting"),
+        "number_of_copies": (("dest", "print", "copies"), "Check the number of copies", "Wrong number of copies"),
+        "blank_page_suppression": (("pipelineOptions", "imageModifications", "blankPageSuppressionEnabled"), "Check the blank page suppression", "Wrong blank page suppression"),
+        "multiple_feed_detect": (("src", "scan", "multipleFeedDetect"), "Check the multiple feed detect", "Wrong multiple feed detect"),
+        "multiple_feed_auto_retry": (("src", "scan", "multipleFeedAutoRetry"), "Check the multiple feed auto retry", "Wrong multiple feed auto retry"),
+        "color_mode": (("src", "scan", "colorMode"), "Check the color mode", "Wrong color mode"),
+        "tray_setting": (("dest", "print", "mediaSource"), "Check the tray setting", "Wrong tray setting"),
+        "sides": (("dest", "print", "duplexBinding"), "Check the sides", "Wrong sides"),
+        "orientation": (("src", "scan", "contentOrientation"), "Check the orientation", "Wrong orientation"),
+        "quality": (("dest", "print", "printQuality"), "Check the quality", "Wrong quality"),
+        "copy_margins": (("dest", "print", "printMargins"), "Check the copy margins", "Wrong copy margins"),
+        "content_type": (("src", "scan", "contentType"), "Check the content type", "Wrong content type"),
+        "two_side_page_flip_up": (("src", "scan", "pagesFlipUpEnabled"), "Check 2 side page flip up", "Wrong 2 side page flip up"),
+        "media_type": (("dest", "print", "mediaType"), "Check media type", "Wrong media type"),
+        "pages_per_sheet": (("pipelineOptions", "imageModifications", "pagesPerSheet"), "Check page per sheet", "Wrong pages per sheet"),
+        "numberUp_presentation_direction": (("pipelineOptions", "imageModifications", "numberUpPresentationDirection"), "Check numberUp presentation direction", "Wrong numberUp presentation direction"),
+        "image_border": (("pipelineOptions", "imageModifications", "imageBorder"), "Check image border", "Wrong image border"),
+        "collate": (("dest", "print", "collate"), "Check the collate", "Wrong collate"),
+        "media_source": (("src", "scan", "mediaSource"), "Check media source", "Wrong Media Source"),
+        "input_plex_mode": (("src", "scan", "plexMode"), "Check media source", "Wrong Media Source"),
+        "output_scale_standard_size_setting": (("pipelineOptions", "scaling", "scaleToSize"), "Check Output Scale Standard Size Setting", "Wrong Standard Size"),
+        "output_scale_loaded_paper_setting": (("pipelineOptions", "scaling", "scaleToOutput"), "Check Output Scale Output Scale Setting", "Wrong Loaded Paper"),
+        "finisher_staple": (("dest", "print", "stapleOption"), "Check staple Setting", "Wrong staple option"),
+        "finisher_punch": (("dest", "print", "punchOption"), "Check punch Setting", "Wrong punch option"),
+        "finisher_fold": (("dest", "print", "foldOption"), "Check fold Setting", "Wrong fold option"),
+        "booklet_format": (("pipelineOptions", "imageModifications", "bookletFormat"), "Check image border", "Wrong booklet format"),
+        "output_plex_mode": (("dest", "print", "plexMode"), "Check media source", "Wrong Media Source"),
+        "finisher_booklet": (("dest", "print", "bookletMakerOption"), "Check bookletmaker Setting", "Wrong bookletMaker option"),
+        "watermark_type": (("pipelineOptions", "watermark", "watermarkType"), "Check watermark type Setting", "Wrong watermark type"),
+        "watermark_Id": (("pipelineOptions", "watermark", "watermarkId"), "Check watermark text Setting", "Wrong watermark text"),
+        "watermark_custom_text": (("pipelineOptions", "watermark", "customText"), "Check watermark custom text Setting", "Wrong watermark custom text"),
+        "watermark_first_page_only": (("pipelineOptions", "watermark", "onlyFirstPage"), "Check watermark first page only Setting", "Wrong watermark first page only"),
+        "watermark_text_font": (("pipelineOptions", "watermark", "textFont"), "Check watermark text font Setting", "Wrong watermark text font"),
+        "watermark_text_size": (("pipelineOptions", "watermark", "textSize"), "Check watermark text size Setting", "Wrong watermark text size"),
+        "watermark_text_color": (("pipelineOptions", "watermark", "textColor"), "Check watermark text color Setting", "Wrong watermark text color"),
+        "watermark_darkness": (("pipelineOptions", "watermark", "darkness"), "Check watermark darkness Setting", "Wrong watermark darkness"),
+        "sharpness": (("pipelineOptions", "imageModifications", "sharpness"), "Check sharpness Setting", "Wrong sharpness setting"),
+        "contrast": (("pipelineOptions", "imageModifications", "contrast"), "Check contrast Setting", "Wrong contrast setting"),
+        "background_cleanup": (("pipelineOptions", "imageModifications", "backgroundCleanup"), "Check background cleanup Setting", "Wrong background cleanup setting"),
+        "auto_paper_color_removal": (("pipelineOptions", "imageModifications", "autoPaperColorRemoval"), "Check auto paper color removal Setting", "Wrong auto paper color removal setting"),
+        "outputBin": (("dest", "print", "mediaDestination"), "Check output bin Setting", "Wrong output bin setting"),
+    }
+    # Same as above for the stamp settings, whose path is relative to pipelineOptions[stamp_location]
+    _STAMP_FIELD_SPEC: ClassVar[Dict[str, Tuple[str, str, str]]] = {
+        "stamp_location_id": ("locationId", "Check stamp location id Setting", "Wrong stamp location id"),
+        "stamp_policy": ("policy", "Check stamp policy Setting", "Wrong stamp policy"),
+        "stamp_content": ("stampContent", "Check stamp content Setting", "Wrong stamp content"),
+        "stamp_text_color": ("textColor", "Check stamp text color Setting", "Wrong stamp text color"),
+        "stamp_text_font": ("textFont", "Check stamp text font Setting", "Wrong stamp text font"),
+        "stamp_text_size": ("textSize", "Check stamp text size Setting", "Wrong stamp text size"),
+        "stamp_starting_page": ("startingPage", "Check stamp starting page Setting", "Wrong stamp starting page"),
+        "stamp_starting_number": ("startingNumber", "Check stamp starting number Setting", "Wrong stamp starting number"),
+        "stamp_num_of_digit": ("numberOfDigits", "Check stamp number of digit Setting", "Wrong stamp number of digit"),
+        "stamp_page_numbering": ("pageNumberingStyle", "Check stamp page numbering Setting", "Wrong stamp page numbering"),
+        "stamp_white_background": ("whiteBackground", "Check stamp white background Setting", "Wrong stamp white background"),
+    }
+
     def validate_settings_used_in_copy(self, original_size=None, paper_size=None, lighter_darker=None,
                                         output_scale_setting=None, number_of_copies: int = None, blank_page_suppression=None,
                                         multiple_feed_detect=None, multiple_feed_auto_retry=None,
@@ -898,237 +1167,43 @@ class Copy(AbstractJobActions):
         :param outputBin:
         """
         logging.info("Verify all the values used for job using cdm")
+        settings = locals()
         copy_job_details = self._job.get_job_details(current_job_type="copy")
 
-        if original_size:
-            logging.info("Check the original size setting")
-            assert copy_job_details["src"]["scan"]["mediaSize"] == original_size, "Wrong original size setting"
-
-        if paper_size:
-            logging.info("Check the paper size setting")
-            assert copy_job_details["dest"]["print"]["mediaSize"] == paper_size, "Wrong paper size setting"
-
-        if lighter_darker:
-            logging.info("Check the lighter/darker setting")
-            assert copy_job_details["pipelineOptions"]["imageModifications"][
-                    "exposure"] == lighter_darker, "Wrong lighter/darker setting"
+        log_checks = logging.getLogger().isEnabledFor(logging.INFO)
+        # Sections of the job details resolved so far, keyed by their path
+        sections: Dict[Tuple[str, ...], Dict] = {}
 
         if output_scale_setting:
             logging.info("Check the output scale setting")
-            scaling_dict = copy_job_details["pipelineOptions"]["scaling"]
+            scaling_dict = sections[("pipelineOptions", "scaling")] = copy_job_details["pipelineOptions"]["scaling"]
             assert scaling_dict.get("scaleToFitEnabled") == output_scale_setting.get(
                 "scaleToFitEnabled") and scaling_dict.get("xScalePercent") == output_scale_setting.get(
                 "yScalePercent") and scaling_dict.get("scaleSelection") == output_scale_setting.get("scaleSelection")
 
-        if number_of_copies:
-            logging.info("Check the number of copies")
-            assert copy_job_details["dest"]["print"]["copies"] == number_of_copies, "Wrong number of copies"
-            
-        if blank_page_suppression:
-            logging.info("Check the blank page suppression")
-            assert copy_job_details["pipelineOptions"]["imageModifications"]["blankPageSuppressionEnabled"] == blank_page_suppression, "Wrong blank page suppression"   
-
-        if multiple_feed_detect:
-            logging.info("Check the multiple feed detect")
-            assert copy_job_details["src"]["scan"]["multipleFeedDetect"] == multiple_feed_detect, "Wrong multiple feed detect"
-
-        if multiple_feed_auto_retry:
-            logging.info("Check the multiple feed auto retry")
-            assert copy_job_details["src"]["scan"]["multipleFeedAutoRetry"] == multiple_feed_auto_retry, "Wrong multiple feed auto retry"
-
-        if color_mode:
-            logging.info("Check the color mode")
-            assert copy_job_details["src"]["scan"]["colorMode"] == color_mode, "Wrong color mode"
-
-        if tray_setting:
-            logging.info("Check the tray setting")
-            assert copy_job_details["dest"]["print"]["mediaSource"] == tray_setting, "Wrong tray setting"
-
-        if sides:
-            logging.info("Check the sides")
-            assert copy_job_details["dest"]["print"]["duplexBinding"] == sides
-
-        if orientation:
-            logging.info("Check the orientation")
-            assert copy_job_details["src"]["scan"]["contentOrientation"] == orientation, "Wrong orientation"
-
-        if quality:
-            logging.info("Check the quality")
-            assert copy_job_details["dest"]["print"]["printQuality"] == quality, "Wrong quality"
-
-        if copy_margins:
-           logging.info("Check the copy margins")
-           assert copy_job_details["dest"]["print"]["printMargins"] == copy_margins, "Wrong copy margins"
-
-        if content_type:
-            logging.info("Check the content type")
-            assert copy_job_details["src"]["scan"]["contentType"] == content_type, "Wrong content type"
-
-        if two_side_page_flip_up:
-            logging.info("Check 2 side page flip up")
-            assert copy_job_details["src"]["scan"][
-                    "pagesFlipUpEnabled"] == two_side_page_flip_up, "Wrong 2 side page flip up"
-        
-        if media_type:
-            logging.info("Check media type")
-            assert copy_job_details["dest"]["print"]["mediaType"] == media_type, "Wrong media type"
-
-        if pages_per_sheet:
-            logging.info("Check page per sheet")
-            assert copy_job_details["pipelineOptions"]["imageModifications"][
-                    "pagesPerSheet"] == pages_per_sheet, "Wrong pages per sheet"
-        
-        if numberUp_presentation_direction:
-            logging.info("Check numberUp presentation direction")
-            assert copy_job_details["pipelineOptions"]["imageModifications"][
-                    "numberUpPresentationDirection"] == numberUp_presentation_direction, "Wrong numberUp presentation direction"
-        
-        if image_border:
-            logging.info("Check image border")
-            assert copy_job_details["pipelineOptions"]["imageModifications"][
-                    "imageBorder"] == image_border, "Wrong image border"
-
-        if collate:
-            logging.info("Check the collate")
-            assert copy_job_details["dest"]["print"]["collate"] == collate, "Wrong collate"
-        
-        if media_source:
-            logging.info("Check media source")
-            assert copy_job_details['src']['scan']['mediaSource'] == media_source, "Wrong Media Source"
-        
-        if input_plex_mode:
-            logging.info("Check media source")
-            assert copy_job_details['src']['scan']['plexMode'] == input_plex_mode, "Wrong Media Source"
+        # Only the settings the caller passed are looked up in the job details
+        for name, (path, log_message, error_message) in self._SETTINGS_FIELD_SPEC.items():
+            expected = settings[name]
+            if not expected:
+                continue
+            if log_checks:
+                logging.info(log_message)
+            section_path = path[:-1]
+            if section_path not in sections:
+                sections[section_path] = functools.reduce(operator.getitem, section_path, copy_job_details)
+            assert sections[section_path][path[-1]] == expected, error_message
+
+        stamp = None
+        for name, (key, log_message, error_message) in self._STAMP_FIELD_SPEC.items():
+            expected = settings[name]
+            if not expected:
+                continue
+            if log_checks:
+                logging.info(log_message)
+            if stamp is None:
+                stamp = copy_job_details["pipelineOptions"][stamp_location]
+            assert stamp[key] == expected, error_message
 
-        if output_scale_standard_size_setting:
-            logging.info("Check Output Scale Standard Size Setting")
-            assert copy_job_details["pipelineOptions"]["scaling"]["scaleToSize"] == output_scale_standard_size_setting, "Wrong Standard Size"
-
-        if output_scale_loaded_paper_setting:
-            logging.info("Check Output Scale Output Scale Setting")
-            assert copy_job_details["pipelineOptions"]["scaling"]["scaleToOutput"] == output_scale_loaded_paper_setting, "Wrong Loaded Paper"
-
-        if finisher_staple:
-            logging.info("Check staple Setting")
-            assert copy_job_details["dest"]["print"]["stapleOption"] == finisher_staple, "Wrong staple option"
-
-        if finisher_punch:
-            logging.info("Check punch Setting")
-            assert copy_job_details["dest"]["print"]["punchOption"] == finisher_punch, "Wrong punch option"
-
-        if finisher_fold:
-            logging.info("Check fold Setting")
-            assert copy_job_details["dest"]["print"]["foldOption"] == finisher_fold, "Wrong fold option"
-        
-        if booklet_format:
-            logging.info("Check image border")
-            assert copy_job_details["pipelineOptions"]["imageModifications"][
-                    "bookletFormat"] == booklet_format, "Wrong booklet format"
-        
-        if output_plex_mode:
-            logging.info("Check media source")
-            assert copy_job_details['dest']['print']['plexMode'] == output_plex_mode, "Wrong Media Source"
-
-        if finisher_booklet:
-            logging.info("Check bookletmaker Setting")
-            assert copy_job_details["dest"]["print"]["bookletMakerOption"] == finisher_booklet, "Wrong bookletMaker option"
-
-        if watermark_type:
-            logging.info("Check watermark type Setting")
-            assert copy_job_details["pipelineOptions"]["watermark"]["watermarkType"] == watermark_type, "Wrong watermark type" 
-
-        if watermark_Id:
-            logging.info("Check watermark text Setting")
-            assert copy_job_details["pipelineOptions"]["watermark"]["watermarkId"] == watermark_Id, "Wrong watermark text"
-        
-        if watermark_custom_text:
-            logging.info("Check watermark custom text Setting")
-            assert copy_job_details["pipelineOptions"]["watermark"]["customText"] == watermark_custom_text, "Wrong watermark custom text"
-        
-        if watermark_first_page_only:
-            logging.info("Check watermark first page only Setting")
-            assert copy_job_details["pipelineOptions"]["watermark"]["onlyFirstPage"] == watermark_first_page_only, "Wrong watermark first page only"
-
-        if watermark_text_font:
-            logging.info("Check watermark text font Setting")
-            assert copy_job_details["pipelineOptions"]["watermark"]["textFont"] == watermark_text_font, "Wrong watermark text font"
-
-        if watermark_text_size:
-            logging.info("Check watermark text size Setting")
-            assert copy_job_details["pipelineOptions"]["watermark"]["textSize"] == watermark_text_size, "Wrong watermark text size"
-
-        if watermark_text_color:
-            logging.info("Check watermark text color Setting")
-            assert copy_job_details["pipelineOptions"]["watermark"]["textColor"] == watermark_text_color, "Wrong watermark text color"
-
-        if watermark_darkness:
-            logging.info("Check watermark darkness Setting")
-            assert copy_job_details["pipelineOptions"]["watermark"]["darkness"] == watermark_darkness, "Wrong watermark darkness"
-            
-        if stamp_location_id:
-            logging.info("Check stamp location id Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["locationId"] == stamp_location_id, "Wrong stamp location id"
-        
-        if stamp_policy:
-            logging.info("Check stamp policy Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["policy"] == stamp_policy, "Wrong stamp policy"
-            
-        if stamp_content:
-            logging.info("Check stamp content Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["stampContent"] == stamp_content, "Wrong stamp content"
-            
-        if stamp_text_color:
-            logging.info("Check stamp text color Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["textColor"] == stamp_text_color, "Wrong stamp text color"
-        
-        if stamp_text_font:
-            logging.info("Check stamp text font Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["textFont"] == stamp_text_font, "Wrong stamp text font"
-        
-        if stamp_text_size:
-            logging.info("Check stamp text size Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["textSize"] == stamp_text_size, "Wrong stamp text size"
-
-        if stamp_starting_page:
-            logging.info("Check stamp starting page Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["startingPage"] == stamp_starting_page, "Wrong stamp starting page"
-        
-        if stamp_starting_number:
-            logging.info("Check stamp starting number Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["startingNumber"] == stamp_starting_number, "Wrong stamp starting number"
-        
-        if stamp_num_of_digit:
-            logging.info("Check stamp number of digit Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["numberOfDigits"] == stamp_num_of_digit, "Wrong stamp number of digit"
-        
-        if stamp_page_numbering:
-            logging.info("Check stamp page numbering Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["pageNumberingStyle"] == stamp_page_numbering, "Wrong stamp page numbering"
-        
-        if stamp_white_background:
-            logging.info("Check stamp white background Setting")
-            assert copy_job_details["pipelineOptions"][stamp_location]["whiteBackground"] == stamp_white_background, "Wrong stamp white background"
-
-        if sharpness:
-            logging.info("Check sharpness Setting")
-            assert copy_job_details["pipelineOptions"]["imageModifications"]["sharpness"] == sharpness, "Wrong sharpness setting"
-
-        if contrast:
-            logging.info("Check contrast Setting")
-            assert copy_job_details["pipelineOptions"]["imageModifications"]["contrast"] == contrast, "Wrong contrast setting"
-
-        if background_cleanup:
-            logging.info("Check background cleanup Setting")
-            assert copy_job_details["pipelineOptions"]["imageModifications"]["backgroundCleanup"] == background_cleanup, "Wrong background cleanup setting"
-
-        if auto_paper_color_removal:    
-            logging.info("Check auto paper color removal Setting")
-            assert copy_job_details["pipelineOptions"]["imageModifications"]["autoPaperColorRemoval"] == auto_paper_color_removal, "Wrong auto paper color removal setting"
-
-        if outputBin:
-            logging.info("Check output bin Setting")
-            assert copy_job_details["dest"]["print"]["mediaDestination"] == outputBin, "Wrong output bin setting"          
-        
     @staticmethod
     def get_copy_default_ticket(cdm):
         """Gets the copy default body
@@ -1141,14 +1216,17 @@ class Copy(AbstractJobActions):
         """
 
         ticket_default_response = cdm.get_raw(cdm.JOB_TICKET_COPY)
-        assert ticket_default_response.status_code < 300
-        ticket_default_body = ticket_default_response.json()
+        _ensure_ok(ticket_default_response, "GET OPERATION WAS UNSUCCESSFUL " + cdm.JOB_TICKET_COPY)
+        if orjson is not None:
+            ticket_default_body = orjson.loads(ticket_default_response.content)
+        else:
+            ticket_default_body = ticket_default_response.json()
         return ticket_default_body
     
     @staticmethod
     def patch_operation_on_default_copy_job_ticket(cdm, ticket_default_body):
         response = cdm.patch_raw(cdm.JOB_TICKET_COPY, ticket_default_body)
-        assert response.status_code == 200, "PATCH OPERATION WAS UNSUCCESSFUL" + cdm.JOB_TICKET_COPY
+        _ensure_ok(response, "PATCH OPERATION WAS UNSUCCESSFUL " + cdm.JOB_TICKET_COPY)
 
     @staticmethod
     def reset_copy_default_ticket(cdm, ticket_body):
@@ -1160,7 +1238,7 @@ class Copy(AbstractJobActions):
 
         """
         put_response = cdm.put_raw(cdm.JOB_TICKET_COPY, ticket_body)
-        assert put_response.status_code < 300
+        _ensure_ok(put_response, "PUT OPERATION WAS UNSUCCESSFUL " + cdm.JOB_TICKET_COPY)
     
     def build_payload(self, settings):
         """
@@ -1171,42 +1249,23 @@ class Copy(AbstractJobActions):
         """
         payload = {}
 
-        source = "scan"
-        if("src" in settings):
-            source = settings["src"]
-        payload["src"] = {}
-        payload["src"][source] = {}
-
-        if ("color_mode" in settings):
-            payload["src"][settings["src"]]["colorMode"] = settings["color_mode"]
-
-        if("resolution" in settings):
-            payload["src"][settings["src"]]["resolution"] = settings["resolution"]
+        source = settings.get("src", "scan")
+        src_settings = payload.setdefault("src", {}).setdefault(source, {})
+        for setting, field in _SRC_FIELDS:
+            if setting in settings:
+                src_settings[field] = settings[setting]
 
         if("output_canvas" in settings):
+            output_canvas = settings["output_canvas"]
             payload["pipelineOptions"] = { "imageModifications" : {
-                "outputCanvasMediaSize": settings["output_canvas"]["outputCanvasMediaSize"],
-                "outputCanvasMediaId": settings["output_canvas"]["outputCanvasMediaId"],
-                "outputCanvasCustomWidth": settings["output_canvas"]["outputCanvasCustomWidth"],
-                "outputCanvasCustomLength": settings["output_canvas"]["outputCanvasCustomLength"],
-                "outputCanvasAnchor": settings["output_canvas"]["outputCanvasAnchor"],
-                "outputCanvasOrientation": settings["output_canvas"]["outputCanvasOrientation"]
+                field: output_canvas[field] for field in _OUTPUT_CANVAS_FIELDS
             }}
 
-        destination = "print"
-        if("dest" in settings):
-            destination = settings["dest"]
-        payload["dest"] = {}
-        payload["dest"][destination] = {}
-
-        if("copies" in settings):
-            payload["dest"][destination]["copies"] = settings["copies"]
-
-        if("rotate" in settings):
-            payload["dest"][destination]["rotate"] = settings["rotate"]
-
-        if("mediaSource" in settings):
-            payload["dest"][destination]["mediaSource"] = settings["mediaSource"]
+        destination = settings.get("dest", "print")
+        dest_settings = payload.setdefault("dest", {}).setdefault(destination, {})
+        for setting, field in _DEST_FIELDS:
+            if setting in settings:
+                dest_settings[field] = settings[setting]
 
         return payload
     
@@ -1241,17 +1300,17 @@ class Copy(AbstractJobActions):
             int: new job id created
         """
         job_id = job.create_job(ticket_id)
-        print("|", ctime(), "| ", "Created Job Id:", job_id)
+        logging.info("Created Job Id: %s", job_id)
         cancelRequested = False
         # Check for job state created
-        job.check_job_state(job_id, "created", max_wait_time)
+        job.check_job_state(job_id, CopyJobState.CREATED, max_wait_time)
         # initialize Job
-        status_code = job.change_job_state(job_id, 'Initialize', 'initializeProcessing')
-        print("|", ctime(), "| ", "Initialized Job Id:", job_id)
+        status_code = job.change_job_state(job_id, 'Initialize', CopyJobAction.INITIALIZE)
+        logging.info("Initialized Job Id: %s", job_id)
         # Check for job state ready
-        job.check_job_state(job_id, "ready", max_wait_time)
-        status_code = job.change_job_state(job_id, 'Prepare_Processing', 'prepareProcessing')
-        print("|", ctime(), "| ", "Started Job with prepare processing, Id:", job_id)
+        job.check_job_state(job_id, CopyJobState.READY, max_wait_time)
+        status_code = job.change_job_state(job_id, 'Prepare_Processing', CopyJobAction.PREPARE)
+        logging.info("Started Job with prepare processing, Id: %s", job_id)
         return job_id
 
     def copy_simulation_force_start_CDM(self, height, width, settings, job, scan_action):
@@ -1277,17 +1336,17 @@ class Copy(AbstractJobActions):
         # Create a Job with the ticket
         job_id = self.start_job_on_prepare_processing_no_completion_check(job, ticket_id, 60)
         # Wait for start processing of job
-        job.check_job_state(job_id, "processing", 30)
+        job.check_job_state(job_id, CopyJobState.PROCESSING, 30)
 
-        # The system need sometimes to be ready to start the job 
-        # TODO change for a tcl for better wait for state
-        time.sleep(20)
+        # The first segment must have finished before the job can be started,
+        # as in proccess_job_two_segment_completion_check
+        job.wait_all_previews_done(job_id)
 
         # Patch start processing to indicate final of job
-        job.change_job_state(job_id, 'Start', 'startProcessing')
+        job.change_job_state(job_id, 'Start', CopyJobAction.START)
 
         # Wait completion status and validate is completed
-        job.check_job_state(job_id, "completed", 80)
+        job.check_job_state(job_id, CopyJobState.COMPLETED, 80)
 
         # Get status job
         job.check_job_completion_status(job_id,"success")
@@ -1318,17 +1377,17 @@ class Copy(AbstractJobActions):
         # Create a Job with the ticket
         job_id = self.start_job_on_prepare_processing_no_completion_check(job, ticket_id, 60)
         # Wait for start processing of job
-        job.check_job_state(job_id, "processing", 30)
+        job.check_job_state(job_id, CopyJobState.PROCESSING, 30)
 
-        # The system need sometimes to be ready to start the job 
-        # TODO change for a tcl for better wait for state
-        time.sleep(20)
+        # The first segment must have finished before the job can be started,
+        # as in proccess_job_two_segment_completion_check
+        job.wait_all_previews_done(job_id)
 
         # Patch start processing to indicate final of job
-        job.change_job_state(job_id, 'Start', 'startProcessing')
+        job.change_job_state(job_id, 'Start', CopyJobAction.START)
 
         # Wait completion status and validate is completed
-        job.check_job_state(job_id, "completed", 80)
+        job.check_job_state(job_id, CopyJobState.COMPLETED, 80)
 
         # Get status job
         job.check_job_completion_status(job_id,"success")
@@ -1356,6 +1415,28 @@ class Copy(AbstractJobActions):
 
         self.do_copy_job(**payload, waitTime=90)
 
+    def _get_copy_constraint_options(self) -> Mapping[str, FrozenSet[str]]:
+        """
+        Get the values allowed by the copy ticket constraints, read at most once every CONSTRAINTS_CACHE_TTL seconds.
+        The index is read-only, so it is returned without being copied.
+        Returns:
+            Mapping[str, FrozenSet[str]]: The allowed seValues, keyed by the propertyPointer they constrain
+        """
+        return self._get_cached('copy_constraint_options', self.CONSTRAINTS_CACHE_TTL, self._read_copy_constraint_options,
+                                copy_result=False)
+
+    def _read_copy_constraint_options(self) -> Mapping[str, FrozenSet[str]]:
+        """
+        Read the copy ticket constraints and index the allowed values by propertyPointer.
+        Returns:
+            Mapping[str, FrozenSet[str]]: The allowed seValues, keyed by the propertyPointer they constrain
+        """
+        options: Dict[str, Set[str]] = {}
+        for validator in self._cdm.get(self._cdm.JOB_TICKET_COPY_CONSTRAINTS)["validators"]:
+            values = options.setdefault(validator.get("propertyPointer"), set())
+            values.update(option.get("seValue") for option in validator.get("options", []))
+        return MappingProxyType({pointer: frozenset(values) for pointer, values in options.items()})
+
     def is_constraints_include_print_margins_in_cdm(self, print_margins = "clipContents"):	
         """Verify if the option is included in print margins by CDM	
         Args:	
@@ -1365,51 +1446,47 @@ class Copy(AbstractJobActions):
             bool	
         """	
 
-        all_validators = self._cdm.get(self._cdm.JOB_TICKET_COPY_CONSTRAINTS)["validators"]	
-        print_margins_supported = False
-
-        for validator in all_validators:	
-            if validator.get("propertyPointer", None) == "dest/print/printMargins":	
-                for option in validator["options"]:	
-                    if print_margins == option.get("seValue"):	
-                        print_margins_supported = True	
-                        break	
-
-        if print_margins_supported == False:	
-            logging.info("The current machine does not support %s" %print_margins)	
-            return print_margins_supported	
-        else:	
-            logging.info("The current machine support %s" %print_margins)	
-            return print_margins_supported
+        print_margins_supported = print_margins in self._get_copy_constraint_options().get("dest/print/printMargins", frozenset())
+        logging.info("The current machine %s %s", "support" if print_margins_supported else "does not support", print_margins)
+        return print_margins_supported
 
     def wait_for_corresponding_scanner_status_with_cdm(self, expected_scanner_status = "Idle", timeout = 100, raise_exception=True,wait_time=1):
         """
             Wait for corresponding scanner status with cdm
             expected_scanner_status (str, optional): [description]. Defaults to "Idle".
             timeout (int, optional): [description]. Defaults to 100.
+            wait_time (int, optional): Longest pause between two status checks. Defaults to 1.
 
         Raises:
             Exception: [description]
         """
-        logging.info(f"wait_for_corresponding_scanner_status_with_cdm -> {expected_scanner_status}")
-        try:
-            state_expected_found = False
-            start_time = time.time()
-            while(time.time()-start_time < timeout):
-                response = self._cdm.get(self._cdm.SCANNER_STATUS)
-                logging.info(f"current status is <{response['scannerState']}>")
-                if response['scannerState'] == expected_scanner_status:
-                    logging.info(f"Expected status: <{expected_scanner_status}> displayed Response: {response}")
-                    state_expected_found = True
-                    break
-                
-                # Wait one second before checking again to avoid override udw system
-                time.sleep(wait_time)
+        logging.info("wait_for_corresponding_scanner_status_with_cdm -> %s", expected_scanner_status)
+        failure_message = "Failed to get scanner status: <%s> with cdm, exception is <%s>"
+        get_status = self._cdm.get
+        status_url = self._cdm.SCANNER_STATUS
+        state_expected_found = False
+        delay = min(self.MIN_POLL_INTERVAL, wait_time)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            # Only the device read is guarded, so the original error is chained to the assertion
+            try:
+                response = get_status(status_url)
+                scanner_state = response['scannerState']
+            except Exception as e:
+                raise AssertionError(failure_message % (expected_scanner_status, e)) from e
+            logging.info("current status is <%s>", scanner_state)
+            if scanner_state == expected_scanner_status:
+                logging.info("Expected status: <%s> displayed Response: %s", expected_scanner_status, response)
+                state_expected_found = True
+                break
             
-            if raise_exception and not state_expected_found:
-                raise Exception(f"Failed to get expected status <{expected_scanner_status}>")
-        except Exception as e:
-            assert False, f"Failed to get scanner status: <{expected_scanner_status}> with cdm, exception is <{e}>"
+            # Back off up to wait_time between checks to avoid override udw system
+            time.sleep(delay)
+            delay = min(delay * 2, wait_time)
+        
+        if raise_exception and not state_expected_found:
+            reason = f"Failed to get expected status <{expected_scanner_status}>"
+            raise AssertionError(failure_message % (expected_scanner_status, reason))
 
 
     def is_constraints_include_media_destination_in_cdm(self, media_destinations = "standard-bin"):
@@ -1421,22 +1498,9 @@ class Copy(AbstractJobActions):
             bool	
         """	
 
-        all_validators = self._cdm.get(self._cdm.JOB_TICKET_COPY_CONSTRAINTS)["validators"]	
-        media_destinations_supported = False	
-
-        for validator in all_validators:	
-            if validator.get("propertyPointer", None) == "dest/print/mediaDestination":	
-                for option in validator["options"]:	
-                    if media_destinations == option.get("seValue"):	
-                        media_destinations_supported = True	
-                        break	
-
-        if media_destinations_supported == False:	
-            logging.info("The current machine does not support %s" %media_destinations)	
-            return media_destinations_supported	
-        else:	
-            logging.info("The current machine support %s" %media_destinations)	
-            return media_destinations_supported            
+        media_destinations_supported = media_destinations in self._get_copy_constraint_options().get("dest/print/mediaDestination", frozenset())
+        logging.info("The current machine %s %s", "support" if media_destinations_supported else "does not support", media_destinations)
+        return media_destinations_supported
     
     def is_constraints_include_staple_option_in_cdm(self, staple_options = "none"):	
         """Verify if the option is included in staple option by CDM	
@@ -1447,22 +1511,9 @@ class Copy(AbstractJobActions):
             bool	
         """	
 
-        all_validators = self._cdm.get(self._cdm.JOB_TICKET_COPY_CONSTRAINTS)["validators"]	
-        staple_supported = False	
-
-        for validator in all_validators:	
-            if validator.get("propertyPointer", None) == "dest/print/stapleOption":	
-                for option in validator["options"]:	
-                    if staple_options == option.get("seValue"):	
-                        staple_supported = True	
-                        break	
-
-        if staple_supported == False:	
-            logging.info("The current machine does not support %s" %staple_options)	
-            return staple_supported	
-        else:	
-            logging.info("The current machine support %s" %staple_options)	
-            return staple_supported     
+        staple_supported = staple_options in self._get_copy_constraint_options().get("dest/print/stapleOption", frozenset())
+        logging.info("The current machine %s %s", "support" if staple_supported else "does not support", staple_options)
+        return staple_supported
 
     def is_constraints_include_punch_option_in_cdm(self, punch_options = "none"):	
         """Verify if the option is included in punch option by CDM	
@@ -1473,42 +1524,29 @@ class Copy(AbstractJobActions):
             bool	
         """	
 
-        all_validators = self._cdm.get(self._cdm.JOB_TICKET_COPY_CONSTRAINTS)["validators"]	
-        punch_supported = False
-
-        for validator in all_validators:	
-            if validator.get("propertyPointer", None) == "dest/print/punchOption":	
-                for option in validator["options"]:	
-                    if punch_options == option.get("seValue"):	
-                        punch_supported = True	
-                        break	
-
-        if punch_supported == False:	
-            logging.info("The current machine does not support %s" %punch_options)	
-            return punch_supported	
-        else:	
-            logging.info("The current machine support %s" %punch_options)	
-            return punch_supported     
+        punch_supported = punch_options in self._get_copy_constraint_options().get("dest/print/punchOption", frozenset())
+        logging.info("The current machine %s %s", "support" if punch_supported else "does not support", punch_options)
+        return punch_supported
 
     def set_copymode_indirect( self ):
         """Set copy mode to indirect
         """
-        self._cdm.put(CdmEndpoints.COPY_CONFIGURATION_ENDPOINT, {"copyMode": "printAfterScanning"})
+        self.set_copy_configuration(copyMode="printAfterScanning")
 
     def set_copymode_direct( self ):
         """Set copy mode to direct
         """
-        self._cdm.put(CdmEndpoints.COPY_CONFIGURATION_ENDPOINT, {"copyMode": "printWhileScanning"})
+        self.set_copy_configuration(copyMode="printWhileScanning")
 
     def set_interrupt_enabled(self):
         """Set allow interrupt to true
         """
-        self._cdm.put(CdmEndpoints.COPY_CONFIGURATION_ENDPOINT, {"allowInterrupt": "true"})
+        self.set_copy_configuration(allowInterrupt="true")
 
     def set_interrupt_disabled(self):
         """Set allow interrupt to false
         """
-        self._cdm.put(CdmEndpoints.COPY_CONFIGURATION_ENDPOINT, {"allowInterrupt": "false"})
+        self.set_copy_configuration(allowInterrupt="false")
 
     def reset_copymode_to_default(self, configuration):
         """Reset copy mode to default
@@ -1521,33 +1559,37 @@ class Copy(AbstractJobActions):
         '''
         Check if copy mode is supported
         '''
-        response = self._cdm.get(CdmEndpoints.COPY_CONFIGURATION_ENDPOINT)
+        response = self._get_current_copy_configuration()
         return "copyMode" in response and response["copyMode"] != "_undefined_"
 
     def is_copymode_indirect( self ):
         """Check if copy mode is indirect
         """
-        response = self._cdm.get(CdmEndpoints.COPY_CONFIGURATION_ENDPOINT)
+        response = self._get_current_copy_configuration()
         return response["copyMode"] == "printAfterScanning"
     
     def is_copymode_direct( self ):
         """Check if copy mode is direct
         """
-        response = self._cdm.get(CdmEndpoints.COPY_CONFIGURATION_ENDPOINT)
+        response = self._get_current_copy_configuration()
         return response["copyMode"] == "printWhileScanning"    
             
     def is_allow_interrupt_active(self):
         """Check if allow interrupt is active
         """
-        response = self._cdm.get(CdmEndpoints.COPY_CONFIGURATION_ENDPOINT)
+        response = self._get_current_copy_configuration()
         return response["allowInterrupt"] == "true"
 
     def configure_copy_image_preview_mode(self, cdm, preview_mode: str = "optional"):
-        # Get the default job ticket body and do patch operation to set the preview mode
-        copy_ticket_default_body = self.get_copy_default_ticket(cdm)
-        default_job_ticket = copy.deepcopy(copy_ticket_default_body)
-        copy_ticket_default_body["pipelineOptions"]["manualUserOperations"]["imagePreviewConfiguration"] = preview_mode
+        # Get the default job ticket body and do patch operation to set the preview mode.
+        # Only the dicts on the path to the changed key are copied, the fetched body is returned untouched
+        default_job_ticket = self.get_copy_default_ticket(cdm)
+        pipeline_options = default_job_ticket["pipelineOptions"]
+        manual_user_operations = dict(pipeline_options["manualUserOperations"], imagePreviewConfiguration=preview_mode)
+        copy_ticket_default_body = dict(default_job_ticket,
+                                        pipelineOptions=dict(pipeline_options, manualUserOperations=manual_user_operations))
         self.patch_operation_on_default_copy_job_ticket(cdm, copy_ticket_default_body)
+        self._invalidate_cache('copy_constraint_options')
         return default_job_ticket
 
     def wait_for_job_state(self, jobid: str, expected_states: List[JobState]) -> str:
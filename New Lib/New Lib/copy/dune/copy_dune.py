@@ -1,5 +1,6 @@
-import inspect
-from typing import Any, Type, cast
+import sys
+from importlib import import_module
+from typing import Any, Callable, ClassVar, Dict, Optional, Type, cast
 import time
 import logging
 
@@ -7,11 +8,22 @@ from typing_extensions import Self  # type: ignore
 
 from dunetuf.copy.copy import Copy
 
+# Lazy loaders for the family specific implementations of CopyDune.
+# Families missing from the registry fall through to plain CopyDune.
+_FAMILY_REGISTRY: Dict[str, Callable[[], type]] = {
+    "enterprise": lambda: import_module("dunetuf.copy.dune.enterprise.copy_enterprise").CopyEnterprise,
+    "designjet": lambda: import_module("dunetuf.copy.dune.designjet.copy_designjet").CopyDesignJet,
+    "homepro": lambda: import_module("dunetuf.copy.dune.homepro.copy_homepro").CopyHomePro,
+}
+
 class CopyDune(Copy):
     """
     Concrete implementation of Copy for Dune-based architecture.
     """
 
+    # Concrete class resolved for each family name, filled on first instantiation
+    _subclass_cache: ClassVar[Dict[str, type]] = {}
+
     def __new__(cls: Type[Self], *args: Any, **kwargs: Any) -> Self:
         """
         Create a new instance of CopyDune or its subclass.
@@ -19,26 +31,19 @@ class CopyDune(Copy):
             An instance of CopyDune or its subclass.
         """
         if cls is CopyDune:
-            caller_frame = inspect.stack()[1]
-            caller_module = inspect.getmodule(caller_frame[0])
-            if caller_module is None or not (
-                caller_module.__name__.startswith("dunetuf.copy.copy")
-            ):
+            caller_name = sys._getframe(1).f_globals.get("__name__", "")
+            if not caller_name.startswith("dunetuf.copy.copy"):
                 raise RuntimeError(
                     "CopyDune (and its subclasses) can only be instantiated via Copy."
                 )
 
-            if cls._family_name == "enterprise":
-                from dunetuf.copy.dune.enterprise.copy_enterprise import CopyEnterprise
-                return cast(Self, CopyEnterprise(*args, **kwargs))
-            elif cls._family_name == "designjet":
-                from dunetuf.copy.dune.designjet.copy_designjet import CopyDesignJet
-                return cast(Self, CopyDesignJet(*args, **kwargs))
-            elif cls._family_name == "homepro":
-                from dunetuf.copy.dune.homepro.copy_homepro import CopyHomePro
-                return cast(Self, CopyHomePro(*args, **kwargs))
-            else:
-                return cast(Self, super().__new__(cls))
+            target = cls._subclass_cache.get(cls._family_name)
+            if target is None:
+                loader = _FAMILY_REGISTRY.get(cls._family_name)
+                target = loader() if loader is not None else CopyDune
+                cls._subclass_cache[cls._family_name] = target
+            if target is not CopyDune:
+                return cast(Self, target(*args, **kwargs))
 
         return cast(Self, super().__new__(cls))
 
@@ -58,11 +63,25 @@ class CopyDune(Copy):
             start_state = self.change_job_state(job_id, 'Start', 'startProcessing')
             return start_state
 
-        time.sleep(2.5)  # Wait for the job to be ready
         start_state = self.change_job_state(job_id, "Start", "startProcessing")
 
         logging.info("Waiting for job to be ready")
-        adf_loaded = self._udw.mainApp.ScanMedia.isMediaLoaded('ADF') #type: ignore
+        self._handle_flatbed_add_page()
+
+        return start_state
+
+    def _handle_flatbed_add_page(self, adf_loaded: Optional[bool] = None) -> None:
+        """
+        Answer the flatbedAddPage alert raised when the originals are on the flatbed.
+        Args:
+            adf_loaded: Whether the ADF has media loaded. When None, the device is
+                        queried once and the result is stored in self._adf_loaded.
+        Returns:
+            None
+        """
+        if adf_loaded is None:
+            adf_loaded = self._udw.mainApp.ScanMedia.isMediaLoaded('ADF') #type: ignore
+            self._adf_loaded = adf_loaded
         try:
             if not adf_loaded:
                 self._job_manager.wait_for_alerts("flatbedAddPage")
@@ -74,24 +93,51 @@ class CopyDune(Copy):
         except TimeoutError:
             logging.info("flatbed Add page is not available")
 
-        return start_state
-
-    def preview_start(self, job_id: str, ticket_id: str, preview_reps: int = 0) -> None:
+    def preview_start(
+        self, job_id: str, ticket_id: str, preview_reps: int = 0,
+        base: float = 0.1, max_delay: float = 2.5
+    ) -> None:
         """
         Start a copy job.
         Args:
             job_id: job id
             ticket_id: ticket id
             preview_reps: Number of times to repeat the preview before executing the copy job
+            base: Initial delay in seconds while waiting for each preview to start
+            max_delay: Maximum time in seconds to wait for each preview to start
         Returns:
-            None
+            None. The job is in the ready state when this method returns.
         """
         super().preview_start(job_id, ticket_id)
-        if preview_reps != 0:
-            for _ in range(preview_reps):
-                self._job_manager.change_job_state(
-                    job_id, "Preview", "prepareProcessing"
-                )
-                time.sleep(2.5)
-                self._job_manager.wait_for_job_state(job_id, ["ready"])
-                logging.info("Preview Job Id : {}".format(job_id))
+        if preview_reps == 0:
+            return
+
+        for _ in range(preview_reps):
+            self._job_manager.change_job_state(
+                job_id, "Preview", "prepareProcessing"
+            )
+            self._wait_for_preview_to_start(job_id, base, max_delay)
+            self._job_manager.wait_for_job_state(job_id, ["ready"])
+            logging.info("Preview Job Id : %s", job_id)
+
+    def _wait_for_preview_to_start(self, job_id: str, base: float, max_delay: float) -> None:
+        """
+        Wait for the job to leave the ready state after a preview request.
+        The job state is polled with an exponential backoff (base, 2*base, 4*base, ...)
+        and the wait gives up once max_delay seconds have been spent.
+        Args:
+            job_id: job id
+            base: Initial delay in seconds
+            max_delay: Maximum total delay in seconds
+        Returns:
+            None
+        """
+        waited = 0.0
+        delay = base
+        while waited < max_delay:
+            delay = min(delay, max_delay - waited)
+            time.sleep(delay)
+            waited += delay
+            if self.get_job_info(job_id).get('state') != 'ready':
+                return
+            delay *= 2
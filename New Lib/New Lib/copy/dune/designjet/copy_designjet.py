@@ -1,5 +1,4 @@
 from dunetuf.copy.dune.copy_dune import CopyDune
-import time
 import logging
 
 
@@ -31,7 +30,7 @@ class CopyDesignJet(CopyDune):
             result = self._job_manager.wait_for_all_previews_done(job_id)
             assert result, "Preview jobs did not finish successfully"
             
-            if self.get_copy_configuration()["copyMode"] == "printWhileScanning":
+            if self.is_copymode_direct():
                 logging.info("Copy mode is already set to printWhileScanning. Wait for start print to finish job.")
                 self._job_manager.wait_for_job_processing_sub_status(status="printing")
 
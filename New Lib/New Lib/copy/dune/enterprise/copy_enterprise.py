@@ -1,7 +1,5 @@
 import logging
 from typing import Dict
-import logging
-import time
 
 from dunetuf.copy.dune.copy_dune import CopyDune
 
@@ -20,8 +18,10 @@ class CopyEnterprise(CopyDune):
             None
         """
         super()._updating_ticket(payload)
-        if payload.get("src", {}).get("scan", {}).get("resolution"):
-            payload["src"]["scan"]["resolution"] = "e600Dpi"
+        src = payload.get("src")
+        scan = src.get("scan") if src else None
+        if scan and scan.get("resolution"):
+            scan["resolution"] = "e600Dpi"
         return payload
 
     def start(
@@ -37,27 +37,14 @@ class CopyEnterprise(CopyDune):
         """
         self.preview_start(job_id, ticket_id, preview_reps)
 
-        time.sleep(2.5)  # Wait for the job to be ready
-        #self._job_manager.wait_for_job_state(job_id, ["ready"])
         start_state = self.change_job_state(job_id, "Start", "startProcessing")
 
         logging.info("Waiting for job to be ready")
-        adf_loaded = self._udw.mainApp.ScanMedia.isMediaLoaded('ADF') #type: ignore
-        try:
-            if preview_reps == 0:
-                if not self._adf_loaded and self._output_duplex is True:
-                    self._job_manager.wait_for_alerts("flatbedAddPage")
-                    self._job_manager.alert_action(
-                        "flatbedAddPage", "Response_02"
-                    )  # TODO: Review this.
-            elif not adf_loaded:
-                self._job_manager.wait_for_alerts("flatbedAddPage")
-                self._job_manager.alert_action(
-                        "flatbedAddPage", "Response_02"
-                    )
-            else:
-                logging.info("ADF is loaded, no need to add flatbed page")
-        except TimeoutError:
-            logging.info("flatbed Add page is not available")
+        if preview_reps == 0:
+            # The ticket already tells whether the originals are on the flatbed
+            if self._output_duplex is True:
+                self._handle_flatbed_add_page(bool(self._adf_loaded))  # TODO: Review this.
+        else:
+            self._handle_flatbed_add_page()
 
         return start_state
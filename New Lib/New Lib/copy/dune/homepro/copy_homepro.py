@@ -1,6 +1,6 @@
-import inspect
+import sys
 import logging
-from typing import Any, Type, cast
+from typing import Any, ClassVar, Dict, Type, cast
 
 from typing_extensions import Self  # type: ignore
 
@@ -13,6 +13,9 @@ class CopyHomePro(CopyDune):
     Currently, no additional logic is implemented.
     """
 
+    # Concrete class resolved for each product name, filled on first instantiation
+    _subclass_cache: ClassVar[Dict[str, type]] = {}
+
     def __new__(cls: Type[Self], *args: Any, **kwargs: Any) -> Self:
         """
         Create a new instance of CopyDune or its subclass.
@@ -21,19 +24,21 @@ class CopyHomePro(CopyDune):
         """
 
         if cls is CopyHomePro:
-            caller_frame = inspect.stack()[1]
-            caller_module = inspect.getmodule(caller_frame[0])
-
-            if caller_module is None or not (
-                caller_module.__name__.startswith("dunetuf.copy.dune.copy_dune")
-            ):
+            caller_name = sys._getframe(1).f_globals.get("__name__", "")
+            if not caller_name.startswith("dunetuf.copy.dune.copy_dune"):
                 raise RuntimeError(
                     "CopyHomePro (and its subclasses) can only be instantiated via CopyDune."
                 )
-            if "beam" in cls._product_name:
-                from dunetuf.copy.dune.homepro.copy_beam import CopyBeam
-                return cast(Self, CopyBeam(*args, **kwargs))
-            else:
-                return cast(Self, super().__new__(cls))
+
+            target = cls._subclass_cache.get(cls._product_name)
+            if target is None:
+                if "beam" in cls._product_name:
+                    from dunetuf.copy.dune.homepro.copy_beam import CopyBeam
+                    target = CopyBeam
+                else:
+                    target = CopyHomePro
+                cls._subclass_cache[cls._product_name] = target
+            if target is not CopyHomePro:
+                return cast(Self, target(*args, **kwargs))
 
         return cast(Self, super().__new__(cls))
\ No newline at end of file
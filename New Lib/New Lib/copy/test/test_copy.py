@@ -2,14 +2,16 @@ from unittest.mock import call
 
 import pytest # type: ignore
 
-from dunetuf.copy.copy import Copy
+from dunetuf.copy.copy import Copy, CopyJobAction, CopyJobState
 
 
 @pytest.fixture
 def copy_instance(mocker):
+    Copy.invalidate_configuration_cache()
+
     # Patch module-level dependencies.
     mocker.patch("dunetuf.copy.copy.get_ip", return_value="127.0.0.1")
-    mock_get_udw = mocker.patch("dunetuf.copy.copy.get_dune_underware_instance")
+    mock_get_udw = mocker.patch("dunetuf.copy.copy.get_underware_instance")
     mock_get_cdm = mocker.patch("dunetuf.copy.copy.get_cdm_instance")
     mock_configuration = mocker.patch("dunetuf.copy.copy.Configuration")
     mock_job = mocker.patch("dunetuf.copy.copy.Job")
@@ -136,7 +138,7 @@ def test_start(copy_instance, mocker):
     copy_instance._job_manager.WAIT_START_JOB_TIMEOUT = 10
 
     # Patch time functions.
-    mocker.patch("dunetuf.copy.copy.time.time", side_effect=[0, 1, 2])
+    mocker.patch("dunetuf.copy.copy.time.monotonic", side_effect=[0, 1, 2])
     mocker.patch("dunetuf.copy.copy.time.sleep")
     copy_instance._job_manager.get_job_info.return_value = {"state": "ready"}
     copy_instance._has_two_segment_pipeline = mocker.MagicMock(return_value=False)
@@ -159,7 +161,7 @@ def test_start_with_two_segment_pipeline(copy_instance, mocker):
     copy_instance._job_manager.change_job_state.return_value = 200
     copy_instance._job_manager.WAIT_START_JOB_TIMEOUT = 10
 
-    mocker.patch("dunetuf.copy.copy.time.time", side_effect=[0, 1, 2])
+    mocker.patch("dunetuf.copy.copy.time.monotonic", side_effect=[0, 1, 2])
     mocker.patch("dunetuf.copy.copy.time.sleep")
     copy_instance._job_manager.get_job_info.return_value = {"state": "ready"}
     copy_instance._has_two_segment_pipeline = mocker.MagicMock(return_value=True)
@@ -177,6 +179,25 @@ def test_start_with_two_segment_pipeline(copy_instance, mocker):
     )
 
 
+def test_has_two_segment_pipeline_is_cached(copy_instance):
+    ticket_id = "ticket_123"
+    copy_instance._job_ticket.get_info.return_value = {
+        "src": {"scan": {"scanCaptureMode": "jobBuild"}}
+    }
+
+    assert copy_instance._has_two_segment_pipeline(ticket_id) is True
+    assert copy_instance._has_two_segment_pipeline(ticket_id) is True
+    copy_instance._job_ticket.get_info.assert_called_once_with(ticket_id)
+
+    copy_instance.update_ticket(ticket_id, {"src": {"scan": {"scanCaptureMode": "standard"}}})
+    copy_instance._job_ticket.get_info.return_value = {
+        "src": {"scan": {"scanCaptureMode": "standard"}}
+    }
+
+    assert copy_instance._has_two_segment_pipeline(ticket_id) is False
+    assert copy_instance._job_ticket.get_info.call_count == 2
+
+
 def test_cancel(copy_instance):
     job_id = "job_456"
     copy_instance._job_manager.cancel_job.return_value = 200
@@ -225,6 +246,16 @@ def test_get_default_ticket(copy_instance):
     )
 
 
+def test_get_default_ticket_reads_device_each_time(copy_instance):
+    get_defaults = copy_instance._job_ticket.get_configuration_defaults_by_type
+    get_defaults.return_value = {"src": {"scan": {}}, "dest": {"print": {}}}
+
+    copy_instance.get_default_ticket()
+    copy_instance.get_default_ticket()
+
+    assert get_defaults.call_count == 2
+
+
 def test_update_default_ticket(copy_instance):
     payload = {
         "src": {"scan": {"colorMode": "color"}},
@@ -255,6 +286,38 @@ def test_get_copy_configuration(copy_instance):
     )
 
 
+def test_get_copy_configuration_reads_device_each_time(copy_instance):
+    config = {"copyMode": "printAfterScanning", "allowInterrupt": "true"}
+    copy_instance.cdm.get.return_value = config
+
+    first = copy_instance.get_copy_configuration()
+    second = copy_instance.get_copy_configuration()
+
+    assert first == second == config
+    assert copy_instance.cdm.get.call_count == 2
+
+
+def test_set_copy_configuration_invalidates_cache(copy_instance):
+    copy_instance.cdm.get.return_value = {"copyMode": "printAfterScanning"}
+    assert copy_instance.is_copymode_indirect() is True
+
+    copy_instance.set_copy_configuration({"copyMode": "printWhileScanning"})
+    copy_instance.cdm.get.return_value = {"copyMode": "printWhileScanning"}
+
+    assert copy_instance.is_copymode_direct() is True
+    assert copy_instance.cdm.get.call_count == 2
+
+
+def test_get_user_ticket_defaults_reads_device_each_time(copy_instance):
+    get_defaults = copy_instance._job_ticket.get_user_defaults_type
+    get_defaults.return_value = {"src": {"scan": {"colorMode": "color"}}}
+
+    copy_instance.get_user_ticket_defaults()
+    copy_instance.get_user_ticket_defaults()
+
+    assert get_defaults.call_count == 2
+
+
 def test_set_copy_configuration(copy_instance):
     payload = {"copyMode": "printWhileScanning", "allowInterrupt": "false"}
 
@@ -265,6 +328,221 @@ def test_set_copy_configuration(copy_instance):
     )
 
 
+def test_wait_until_ready(copy_instance, mocker):
+    job_id = "job_456"
+    copy_instance._job_manager.WAIT_START_JOB_TIMEOUT = 10
+
+    mocker.patch("dunetuf.copy.copy.time.monotonic", side_effect=[0, 1, 2])
+    mock_sleep = mocker.patch("dunetuf.copy.copy.time.sleep")
+    copy_instance._job_manager.get_job_info.side_effect = [
+        {"state": "initializing"},
+        {"state": "ready"},
+    ]
+
+    copy_instance._wait_until_ready(job_id)
+
+    mock_sleep.assert_called_once_with(copy_instance.MIN_POLL_INTERVAL)
+    assert copy_instance._job_manager.get_job_info.call_count == 2
+
+
+def test_poll_until_backs_off(copy_instance, mocker):
+    mocker.patch("dunetuf.copy.copy.time.monotonic", side_effect=[0, 1, 2, 3, 4])
+    mock_sleep = mocker.patch("dunetuf.copy.copy.time.sleep")
+    predicate = mocker.MagicMock(side_effect=[False, False, False, True])
+
+    copy_instance._poll_until(predicate, timeout=10, initial=0.5, max_interval=1.5)
+
+    assert mock_sleep.call_args_list == [call(0.5), call(1.0), call(1.5)]
+    assert predicate.call_count == 4
+
+
+def test_poll_until_starts_at_min_poll_interval(copy_instance, mocker):
+    mocker.patch("dunetuf.copy.copy.time.monotonic", side_effect=[0, 1, 2])
+    mock_sleep = mocker.patch("dunetuf.copy.copy.time.sleep")
+    predicate = mocker.MagicMock(side_effect=[False, True])
+
+    copy_instance._poll_until(predicate, timeout=10)
+
+    mock_sleep.assert_called_once_with(copy_instance.MIN_POLL_INTERVAL)
+
+
+def test_job_in_history(copy_instance):
+    copy_instance._job.get_job_history.return_value = [{"jobId": "job1"}, {"jobId": "job2"}]
+
+    assert copy_instance._job_in_history("job2") is True
+    assert copy_instance._job_in_history("job3") is False
+
+
+def test_job_state_enums_format_as_values():
+    assert str(CopyJobState.READY) == "ready"
+    assert f"{CopyJobAction.START}" == "startProcessing"
+    assert "%s" % CopyJobState.COMPLETED == "completed"
+
+
+def test_configuration_follows_reassigned_configuration(copy_instance, mocker):
+    first = copy_instance.configuration
+    replacement = mocker.MagicMock()
+    copy_instance._configuration = replacement
+
+    assert first is not replacement
+    assert copy_instance.configuration is replacement
+
+
+def test_remove_generated_output_reuses_and_reconnects_ssh(copy_instance, mocker):
+    mocker.patch.dict("dunetuf.copy.copy._ssh_connections", clear=True)
+    dropped, fresh = mocker.MagicMock(), mocker.MagicMock()
+    dropped.run.side_effect = [None, ConnectionError("connection lost")]
+    mock_ssh = mocker.patch("dunetuf.copy.copy.SSH", side_effect=[dropped, fresh])
+
+    copy_instance._remove_generated_output()
+    copy_instance._remove_generated_output()
+
+    assert mock_ssh.call_count == 2
+    fresh.run.assert_called_once_with('rm -f /tmp/PUID_*.tiff')
+
+
+def test_validate_settings_used_in_copy(copy_instance):
+    copy_instance._job.get_job_details.return_value = {
+        "src": {"scan": {"colorMode": "color"}},
+        "dest": {"print": {"copies": 2}},
+        "pipelineOptions": {"stampTopLeft": {"policy": "guided"}},
+    }
+
+    copy_instance.validate_settings_used_in_copy(color_mode="color", number_of_copies=2,
+                                                 stamp_location="stampTopLeft", stamp_policy="guided")
+
+    with pytest.raises(AssertionError, match="Wrong number of copies"):
+        copy_instance.validate_settings_used_in_copy(number_of_copies=3)
+
+
+def test_has_two_segment_pipeline_without_scan_settings(copy_instance):
+    copy_instance._job_ticket.get_info.return_value = {"dest": {"print": {}}}
+
+    assert copy_instance._has_two_segment_pipeline("ticket_123") is False
+
+
+def test_has_two_segment_pipeline_with_null_sections(copy_instance):
+    assert copy_instance._has_two_segment_pipeline("ticket_123", get_ticket=lambda t: {"src": None}) is False
+    assert copy_instance._has_two_segment_pipeline("ticket_456", get_ticket=lambda t: {"src": {"scan": None}}) is False
+
+
+def test_has_two_segment_pipeline_shares_cache(copy_instance):
+    ticket_id = "ticket_123"
+    copy_instance._job.get_job_ticket_info.return_value = {
+        "src": {"scan": {"scanCaptureMode": "jobBuild"}}
+    }
+
+    assert copy_instance.has_two_segment_pipeline(ticket_id) is True
+    assert copy_instance._has_two_segment_pipeline(ticket_id) is True
+    copy_instance._job.get_job_ticket_info.assert_called_once_with(ticket_id)
+    copy_instance._job_ticket.get_info.assert_not_called()
+
+
+def test_cancel_and_verify_removed(copy_instance):
+    copy_instance._job.get_job_history.return_value = [{"jobId": "job1"}]
+
+    copy_instance._cancel_and_verify_removed("job2")
+    copy_instance._job.cancel_job.assert_called_once_with("job2")
+
+    with pytest.raises(AssertionError, match="Unexpected job in job history!"):
+        copy_instance._cancel_and_verify_removed("job1")
+
+
+def test_wait_for_corresponding_scanner_status_backs_off(copy_instance, mocker):
+    copy_instance._cdm.get.side_effect = [
+        {"scannerState": "Processing"},
+        {"scannerState": "Processing"},
+        {"scannerState": "Processing"},
+        {"scannerState": "Idle"},
+    ]
+    mock_sleep = mocker.patch("dunetuf.copy.copy.time.sleep")
+
+    copy_instance.wait_for_corresponding_scanner_status_with_cdm("Idle", timeout=10, wait_time=0.3)
+
+    assert mock_sleep.call_args_list == [call(0.1), call(0.2), call(0.3)]
+
+
+def test_constraint_validators_are_cached(copy_instance):
+    copy_instance.cdm.get.return_value = {
+        "validators": [
+            {"propertyPointer": "dest/print/stapleOption", "options": [{"seValue": "topLeftOnePointAny"}]},
+            {"propertyPointer": "dest/print/punchOption", "options": [{"seValue": "none"}]},
+        ]
+    }
+
+    assert copy_instance.is_constraints_include_staple_option_in_cdm("topLeftOnePointAny") is True
+    assert copy_instance.is_constraints_include_punch_option_in_cdm("leftTwoPointDin") is False
+    copy_instance.cdm.get.assert_called_once_with(copy_instance.cdm.JOB_TICKET_COPY_CONSTRAINTS)
+    assert copy_instance._get_copy_constraint_options() is copy_instance._get_copy_constraint_options()
+
+
+def test_update_default_ticket_invalidates_constraint_cache(copy_instance):
+    copy_instance.cdm.get.return_value = {
+        "validators": [{"propertyPointer": "dest/print/stapleOption", "options": [{"seValue": "none"}]}]
+    }
+    assert copy_instance.is_constraints_include_staple_option_in_cdm("topLeftOnePointAny") is False
+
+    copy_instance.update_default_ticket({"dest": {"print": {"stapleOption": "topLeftOnePointAny"}}})
+    copy_instance.cdm.get.return_value = {
+        "validators": [{"propertyPointer": "dest/print/stapleOption", "options": [{"seValue": "topLeftOnePointAny"}]}]
+    }
+
+    assert copy_instance.is_constraints_include_staple_option_in_cdm("topLeftOnePointAny") is True
+    assert copy_instance.cdm.get.call_count == 2
+
+
+def test_build_payload_defaults_source_and_destination(copy_instance):
+    payload = copy_instance.build_payload({"color_mode": "color", "resolution": "e300Dpi", "copies": 2})
+
+    assert payload == {
+        "src": {"scan": {"colorMode": "color", "resolution": "e300Dpi"}},
+        "dest": {"print": {"copies": 2}},
+    }
+
+
+def test_configure_copy_image_preview_mode_keeps_default_ticket(copy_instance, mocker):
+    default_ticket = {"pipelineOptions": {"manualUserOperations": {"imagePreviewConfiguration": "disable"}}}
+    mocker.patch.object(copy_instance, "get_copy_default_ticket", return_value=default_ticket)
+    mock_patch = mocker.patch.object(copy_instance, "patch_operation_on_default_copy_job_ticket")
+
+    result = copy_instance.configure_copy_image_preview_mode(copy_instance.cdm, "optional")
+
+    assert result == {"pipelineOptions": {"manualUserOperations": {"imagePreviewConfiguration": "disable"}}}
+    mock_patch.assert_called_once_with(
+        copy_instance.cdm,
+        {"pipelineOptions": {"manualUserOperations": {"imagePreviewConfiguration": "optional"}}},
+    )
+
+
+def test_copy_mode_checks_share_one_read(copy_instance):
+    copy_instance.cdm.get.return_value = {"copyMode": "printWhileScanning", "allowInterrupt": "true"}
+
+    assert copy_instance.is_copymode_supported() is True
+    assert copy_instance.is_copymode_direct() is True
+    assert copy_instance.is_allow_interrupt_active() is True
+    copy_instance.cdm.get.assert_called_once_with(copy_instance.cdm.COPY_CONFIGURATION_ENDPOINT)
+
+
+def test_copy_mode_checks_read_device_again_after_short_ttl(copy_instance, mocker):
+    copy_instance.cdm.get.return_value = {"copyMode": "printWhileScanning"}
+    mocker.patch("dunetuf.copy.copy.time.monotonic", side_effect=[100.0, 100.2, 101.0])
+
+    assert copy_instance.is_copymode_direct() is True
+    assert copy_instance.is_copymode_direct() is True
+    copy_instance.cdm.get.return_value = {"copyMode": "printAfterScanning"}
+    assert copy_instance.is_copymode_indirect() is True
+    assert copy_instance.cdm.get.call_count == 2
+
+
+def test_set_copy_configuration_merges_settings(copy_instance):
+    copy_instance.set_copy_configuration(copyMode="printAfterScanning", allowInterrupt="false")
+
+    copy_instance.cdm.put.assert_called_once_with(
+        copy_instance.cdm.COPY_CONFIGURATION_ENDPOINT,
+        {"copyMode": "printAfterScanning", "allowInterrupt": "false"},
+    )
+
+
 # === UNHAPPY PATH TESTS ===
 
 
@@ -321,7 +599,7 @@ def test_start_timeout_waiting_for_ready(copy_instance, mocker):
     copy_instance._job_manager.WAIT_START_JOB_TIMEOUT = 5
 
     # Simulate time progressing beyond the timeout.
-    mocker.patch("dunetuf.copy.copy.time.time", side_effect=[0, 2, 4, 6, 8])
+    mocker.patch("dunetuf.copy.copy.time.monotonic", side_effect=[0, 2, 4, 6, 8])
     mocker.patch("dunetuf.copy.copy.time.sleep")
     copy_instance._job_manager.get_job_info.return_value = {"state": "initializing"}
 
@@ -330,6 +608,18 @@ def test_start_timeout_waiting_for_ready(copy_instance, mocker):
     assert "Job has not reached the ready state" in str(exc_info.value)
 
 
+def test_wait_until_ready_timeout(copy_instance, mocker):
+    job_id = "job_456"
+
+    mocker.patch("dunetuf.copy.copy.time.monotonic", side_effect=[0, 1, 2, 3])
+    mocker.patch("dunetuf.copy.copy.time.sleep")
+    copy_instance._job_manager.get_job_info.return_value = {"state": "initializing"}
+
+    with pytest.raises(TimeoutError) as exc_info:
+        copy_instance._wait_until_ready(job_id, timeout=2)
+    assert "Job has not reached the ready state after 2 seconds" in str(exc_info.value)
+
+
 def test_cancel_nonexistent_job(copy_instance):
     invalid_job_id = "nonexistent_job"
     copy_instance._job_manager.cancel_job.return_value = 404
@@ -392,4 +682,21 @@ def test_set_copy_configuration_failure(copy_instance):
 
     with pytest.raises(ValueError) as exc_info:
         copy_instance.set_copy_configuration(invalid_payload)
-    assert str(exc_info.value) == error_message
\ No newline at end of file
+    assert str(exc_info.value) == error_message
+
+
+def test_wait_for_corresponding_scanner_status_chains_read_error(copy_instance):
+    copy_instance._cdm.get.side_effect = ConnectionError("device unreachable")
+
+    with pytest.raises(AssertionError, match="device unreachable") as exc_info:
+        copy_instance.wait_for_corresponding_scanner_status_with_cdm("Idle", timeout=1)
+    assert isinstance(exc_info.value.__cause__, ConnectionError)
+
+
+def test_reset_copy_default_ticket_failure(copy_instance, mocker):
+    cdm = mocker.MagicMock()
+    cdm.JOB_TICKET_COPY = "/cdm/jobTicket/v1/configuration/defaults/copy"
+    cdm.put_raw.return_value = mocker.MagicMock(status_code=400, text="Bad Request")
+
+    with pytest.raises(RuntimeError, match="400 Bad Request"):
+        Copy.reset_copy_default_ticket(cdm, {})
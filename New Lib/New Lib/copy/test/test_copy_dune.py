@@ -0,0 +1,179 @@
+from unittest.mock import call
+
+import pytest # type: ignore
+
+from dunetuf.copy.copy import Cancel, Copy
+from dunetuf.copy.dune.copy_dune import CopyDune
+
+
+@pytest.fixture
+def make_copy(mocker):
+    Copy.invalidate_configuration_cache()
+    mocker.patch.dict(CopyDune._subclass_cache, clear=True)
+
+    # Patch module-level dependencies.
+    mocker.patch("dunetuf.copy.copy.get_ip", return_value="127.0.0.1")
+    mocker.patch("dunetuf.copy.copy.get_underware_instance")
+    mocker.patch("dunetuf.copy.copy.get_cdm_instance")
+    mock_configuration = mocker.patch("dunetuf.copy.copy.Configuration")
+    for name in ("Job", "JobManager", "JobTicket", "JobConfiguration", "JobCapabilities"):
+        mocker.patch(f"dunetuf.copy.copy.{name}")
+
+    def make(family_name):
+        # Go through the Copy.__new__ dispatch, as the tests using the library do.
+        mock_configuration.return_value.familyname = family_name
+        copy_inst = Copy()
+        mocker.patch.object(copy_inst, "preview_start")
+        copy_inst._job_manager.change_job_state.return_value = 200
+        return copy_inst
+
+    yield make
+    Copy.invalidate_configuration_cache()
+
+
+def _record_device_calls(copy_inst, adf_loaded):
+    """Record the Start request, ADF query and alert calls in the order they are made."""
+    events = []
+    copy_inst._job_manager.change_job_state.side_effect = lambda *args: events.append(call.change_job_state(*args)) or 200
+    copy_inst._udw.mainApp.ScanMedia.isMediaLoaded.side_effect = lambda *args: events.append(call.isMediaLoaded(*args)) or adf_loaded
+    copy_inst._job_manager.wait_for_alerts.side_effect = lambda *args: events.append(call.wait_for_alerts(*args))
+    copy_inst._job_manager.alert_action.side_effect = lambda *args: events.append(call.alert_action(*args))
+    return events
+
+
+def test_copy_dune_start_without_preview(make_copy):
+    copy_dune = make_copy("dune")
+
+    result = copy_dune.start("job_456", "ticket_123")
+
+    assert type(copy_dune) is CopyDune
+    assert result == 200
+    copy_dune.preview_start.assert_called_once_with("job_456", "ticket_123", 0)
+    copy_dune._job_manager.change_job_state.assert_called_once_with("job_456", "Start", "startProcessing", None)
+    copy_dune._udw.mainApp.ScanMedia.isMediaLoaded.assert_not_called()
+    copy_dune._job_manager.wait_for_alerts.assert_not_called()
+
+
+def test_copy_dune_start_after_preview_answers_flatbed_alert(make_copy):
+    copy_dune = make_copy("dune")
+    events = _record_device_calls(copy_dune, adf_loaded=False)
+
+    result = copy_dune.start("job_456", "ticket_123", preview_reps=1)
+
+    assert result == 200
+    assert events == [
+        call.change_job_state("job_456", "Start", "startProcessing", None),
+        call.isMediaLoaded("ADF"),
+        call.wait_for_alerts("flatbedAddPage"),
+        call.alert_action("flatbedAddPage", "Response_02"),
+    ]
+    assert copy_dune._adf_loaded is False
+
+
+def test_copy_dune_start_after_preview_with_adf_loaded(make_copy):
+    copy_dune = make_copy("dune")
+    events = _record_device_calls(copy_dune, adf_loaded=True)
+
+    copy_dune.start("job_456", "ticket_123", preview_reps=2)
+
+    assert events == [
+        call.change_job_state("job_456", "Start", "startProcessing", None),
+        call.isMediaLoaded("ADF"),
+    ]
+
+
+def test_copy_dune_start_without_flatbed_alert(make_copy):
+    copy_dune = make_copy("dune")
+    copy_dune._udw.mainApp.ScanMedia.isMediaLoaded.return_value = False
+    copy_dune._job_manager.wait_for_alerts.side_effect = TimeoutError("no flatbedAddPage alert")
+
+    result = copy_dune.start("job_456", "ticket_123", preview_reps=1)
+
+    assert result == 200
+    copy_dune._job_manager.alert_action.assert_not_called()
+
+
+def _flatbed_ticket(output_plex_mode):
+    return {"src": {"scan": {"mediaSource": "flatbed"}}, "dest": {"print": {"plexMode": output_plex_mode}}}
+
+
+def test_copy_enterprise_start_without_preview_answers_flatbed_alert_for_duplex(make_copy):
+    copy_enterprise = make_copy("enterprise")
+    copy_enterprise._updating_ticket(_flatbed_ticket("duplex"))
+    events = _record_device_calls(copy_enterprise, adf_loaded=True)
+
+    result = copy_enterprise.start("job_456", "ticket_123")
+
+    assert type(copy_enterprise).__name__ == "CopyEnterprise"
+    assert result == 200
+    # The ticket says the originals are on the flatbed, so the ADF is not queried
+    assert events == [
+        call.change_job_state("job_456", "Start", "startProcessing", None),
+        call.wait_for_alerts("flatbedAddPage"),
+        call.alert_action("flatbedAddPage", "Response_02"),
+    ]
+
+
+def test_copy_enterprise_start_without_preview_skips_flatbed_alert_for_simplex(make_copy):
+    copy_enterprise = make_copy("enterprise")
+    copy_enterprise._updating_ticket(_flatbed_ticket("simplex"))
+    events = _record_device_calls(copy_enterprise, adf_loaded=False)
+
+    copy_enterprise.start("job_456", "ticket_123")
+
+    assert events == [call.change_job_state("job_456", "Start", "startProcessing", None)]
+
+
+def test_copy_enterprise_start_without_preview_skips_flatbed_alert_for_adf(make_copy):
+    copy_enterprise = make_copy("enterprise")
+    copy_enterprise._updating_ticket({"dest": {"print": {"plexMode": "duplex"}}})
+    events = _record_device_calls(copy_enterprise, adf_loaded=False)
+
+    copy_enterprise.start("job_456", "ticket_123")
+
+    assert events == [call.change_job_state("job_456", "Start", "startProcessing", None)]
+
+
+@pytest.mark.parametrize("output_plex_mode", ["duplex", "simplex"])
+def test_copy_enterprise_start_after_preview_queries_adf(make_copy, output_plex_mode):
+    copy_enterprise = make_copy("enterprise")
+    copy_enterprise._updating_ticket(_flatbed_ticket(output_plex_mode))
+    events = _record_device_calls(copy_enterprise, adf_loaded=False)
+
+    result = copy_enterprise.start("job_456", "ticket_123", preview_reps=1)
+
+    assert result == 200
+    assert events == [
+        call.change_job_state("job_456", "Start", "startProcessing", None),
+        call.isMediaLoaded("ADF"),
+        call.wait_for_alerts("flatbedAddPage"),
+        call.alert_action("flatbedAddPage", "Response_02"),
+    ]
+
+
+@pytest.mark.parametrize("output_plex_mode", ["duplex", "simplex"])
+def test_copy_enterprise_start_after_preview_with_adf_loaded(make_copy, output_plex_mode):
+    copy_enterprise = make_copy("enterprise")
+    copy_enterprise._updating_ticket(_flatbed_ticket(output_plex_mode))
+    events = _record_device_calls(copy_enterprise, adf_loaded=True)
+
+    copy_enterprise.start("job_456", "ticket_123", preview_reps=1)
+
+    assert events == [
+        call.change_job_state("job_456", "Start", "startProcessing", None),
+        call.isMediaLoaded("ADF"),
+    ]
+
+
+@pytest.mark.parametrize("flow", ["do_copy_job", "do_copy_preview_job"])
+@pytest.mark.parametrize("familyname, expected_resolution", [("enterprise", "e600Dpi"), ("home", "e300Dpi")])
+def test_copy_enterprise_job_resolution_follows_familyname(make_copy, mocker, flow, familyname, expected_resolution):
+    copy_enterprise = make_copy("enterprise")
+    get_ticket = mocker.patch.object(copy_enterprise, "get_copy_job_ticket", return_value="ticket_123")
+    mocker.patch.object(copy_enterprise, "_cancel_and_verify_removed")
+    mocker.patch.object(copy_enterprise, "_remove_generated_output")
+    payload = {"src": {"scan": {"resolution": "e300Dpi"}}}
+
+    getattr(copy_enterprise, flow)(familyname=familyname, cancel=Cancel.after_create, **payload)
+
+    assert get_ticket.call_args.args[0]["src"]["scan"]["resolution"] == expected_resolution